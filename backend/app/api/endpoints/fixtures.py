@@ -6,7 +6,7 @@ from pathlib import Path
 import logging
 
 from ...database import get_db
-from ...schemas.fixture import Fixture, FixtureCreate, FixtureUpdate
+from ...schemas.fixture import Fixture, FixtureCreate, FixtureSummary, FixtureUpdate
 from ...crud import fixture as crud_fixture
 from ...models.versioning import FixtureVersion
 from ...auth import current_active_user
@@ -68,7 +68,7 @@ async def create_fixture(
     return db_fixture
 
 
-@router.get("/", response_model=List[Fixture])
+@router.get("/", response_model=List[FixtureSummary])
 def read_fixtures(
     skip: int = 0,
     limit: int = 100,
@@ -125,10 +125,10 @@ async def update_fixture(
     
     # Create version before update if requested
     if auto_version:
-        _create_version(db, db_fixture)
+        db_fixture.version = _create_version(db, db_fixture).version
     
     # Update fixture with updated_by field
-    updated_fixture = crud_fixture.update_fixture(
+    updated_fixture = await crud_fixture.update_fixture(
         db=db, 
         fixture_id=fixture_id, 
         fixture=fixture,
@@ -185,8 +185,7 @@ def get_fixture_versions(
 ):
     """Get all versions of a fixture"""
     # Check if fixture exists
-    fixture = crud_fixture.get_fixture(db, fixture_id=fixture_id)
-    if not fixture:
+    if not crud_fixture.fixture_exists(db, fixture_id):
         raise HTTPException(status_code=404, detail="Fixture not found")
     
     # Get all versions
@@ -384,10 +383,10 @@ async def regenerate_fixture_file(
     if not fixture:
         raise HTTPException(status_code=404, detail="Fixture not found")
     
-    # Get project information
+    # Only the project name is needed for file generation
     from ...models.project import Project
-    project = db.query(Project).filter(Project.id == fixture.project_id).first()
-    if not project:
+    project_name = db.query(Project.name).filter(Project.id == fixture.project_id).scalar()
+    if project_name is None:
         raise HTTPException(status_code=404, detail="Project not found")
     
     try:
@@ -396,7 +395,7 @@ async def regenerate_fixture_file(
             name=fixture.name,
             fixture_type=fixture.type,
             content=fixture.playwright_script or "// Add your fixture code here",
-            description=f"Fixture for {project.name}"
+            description=f"Fixture for {project_name}"
         )
         
         if not fixture_result['success']:
@@ -407,7 +406,7 @@ async def regenerate_fixture_file(
         
         # Save to local project
         save_result = fixture_generator.save_fixture_to_project(
-            project_name=project.name,
+            project_name=project_name,
             fixture_result=fixture_result
         )
         
@@ -448,21 +447,21 @@ def list_project_fixture_files(
     current_user: User = Depends(current_active_user)
 ):
     """List all fixture files in a project's local directory"""
-    # Get project information
+    # Only the project name is needed to locate the files
     from ...models.project import Project
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    project_name = db.query(Project.name).filter(Project.id == project_id).scalar()
+    if project_name is None:
         raise HTTPException(status_code=404, detail="Project not found")
     
     try:
         # List fixtures from local project
-        local_fixtures = fixture_generator.list_project_fixtures(project.name)
+        local_fixtures = fixture_generator.list_project_fixtures(project_name)
         
         # Get database fixtures for comparison
         db_fixtures = crud_fixture.get_fixtures_by_project(db, project_id=project_id)
         
         # Create mapping for comparison
-        db_fixture_map = {f.export_name: f for f in db_fixtures if f.export_name}
+        db_fixture_map = {f["export_name"]: f for f in db_fixtures if f["export_name"]}
         
         result = []
         for local_fixture in local_fixtures:
@@ -470,13 +469,13 @@ def list_project_fixture_files(
             result.append({
                 **local_fixture,
                 "in_database": bool(db_fixture),
-                "database_id": str(db_fixture.id) if db_fixture else None,
-                "sync_status": "synced" if db_fixture and db_fixture.fixture_file_path == local_fixture['file_path'] else "out_of_sync"
+                "database_id": str(db_fixture["id"]) if db_fixture else None,
+                "sync_status": "synced" if db_fixture and db_fixture["fixture_file_path"] == local_fixture['file_path'] else "out_of_sync"
             })
         
         return {
             "project_id": project_id,
-            "project_name": project.name,
+            "project_name": project_name,
             "fixtures": result,
             "total_files": len(result),
             "synced_count": len([f for f in result if f['sync_status'] == 'synced'])
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List, Dict
 
@@ -222,6 +223,7 @@ async def upsert_project_setting(
     project_id: str,
     key: str,
     value: str,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -236,7 +238,8 @@ async def upsert_project_setting(
         project_id=project_id,
         key=key,
         value=value,
-        updated_by=str(current_user.id)
+        updated_by=str(current_user.id),
+        background_tasks=background_tasks
     )
     return setting
 
@@ -277,9 +280,8 @@ async def regenerate_playwright_config(
         raise HTTPException(status_code=404, detail="Project not found")
     
     try:
-        # Import the function from project_setting crud
-        from ...crud.project_setting import _regenerate_playwright_config
-        await _regenerate_playwright_config(db, project_id)
+        # Run inline so the response reflects the write; the file IO stays off the event loop
+        await run_in_threadpool(crud_setting.regenerate_playwright_config, project_id)
         return {"message": "Playwright configuration regenerated successfully"}
     except Exception as e:
         raise HTTPException(
@@ -400,6 +402,8 @@ def delete_project_release(
 def get_release_test_cases(
     project_id: str,
     release_id: str,
+    skip: int = 0,
+    limit: int = 100,
     db: Session = Depends(get_db)
 ):
     """Get test cases in a release"""
@@ -412,7 +416,9 @@ def get_release_test_cases(
     if release is None or release.project_id != project_id:
         raise HTTPException(status_code=404, detail="Release not found for this project")
     
-    test_cases = crud_release.get_release_test_cases_with_details(db, release_id=release_id)
+    test_cases = crud_release.get_release_test_cases_with_details(
+        db, release_id=release_id, skip=skip, limit=limit
+    )
     return test_cases
 
 
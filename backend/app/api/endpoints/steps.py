@@ -2,14 +2,19 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
+import logging
 
 from ...database import get_db
 from ...schemas.step import Step, StepCreate, StepUpdate, StepReorder
 from ...crud import step as crud_step
+from ...crud.fixture import regenerate_fixture_with_steps
+from ...crud.test_case import regenerate_test_case_script
 from ...models.versioning import StepVersion
 from ...models.user import User
 from ...auth import current_active_user
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -40,9 +45,6 @@ async def create_test_case_step(
     db: Session = Depends(get_db)
 ):
     """Create new step for a test case"""
-    import logging
-    logger = logging.getLogger(__name__)
-    
     logger.info(f"=== CREATE TEST CASE STEP DEBUG START ===")
     logger.info(f"Creating test case step:")
     logger.info(f"  - test_case_id: {test_case_id}")
@@ -70,7 +72,6 @@ async def create_test_case_step(
     logger.info(f"  - step.referenced_fixture_id: {created_step.referenced_fixture_id}")
     
     # Auto-regenerate test case file with new step
-    from ...crud.test_case import regenerate_test_case_script
     try:
         logger.info("Starting test case file regeneration...")
         await regenerate_test_case_script(db, str(created_step.test_case_id))
@@ -103,9 +104,6 @@ async def create_fixture_step(
     db: Session = Depends(get_db)
 ):
     """Create new step that references a fixture"""
-    import logging
-    logger = logging.getLogger(__name__)
-    
     logger.warning(f"=== CREATE FIXTURE STEP CALLED (UNEXPECTED?) ===")
     logger.warning(f"Creating fixture step:")
     logger.warning(f"  - fixture_id: {fixture_id}")
@@ -133,7 +131,6 @@ async def create_fixture_step(
     logger.warning(f"  - step.referenced_fixture_id: {created_step.referenced_fixture_id}")
     
     # Auto-regenerate fixture file with new step
-    from ...crud.fixture import regenerate_fixture_with_steps
     try:
         logger.warning("Starting fixture file regeneration...")
         await regenerate_fixture_with_steps(db, fixture_id)
@@ -193,24 +190,18 @@ async def update_step(
     
     # Auto-regenerate fixture file if step belongs to a fixture
     if updated_step.referenced_fixture_id:
-        from ...crud.fixture import regenerate_fixture_with_steps
         try:
             await regenerate_fixture_with_steps(db, str(updated_step.referenced_fixture_id))
         except Exception as e:
             # Log error but don't fail the step update
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Failed to regenerate fixture file after updating step: {str(e)}")
     
     # Auto-regenerate test case file if step belongs to a test case
     if updated_step.test_case_id:
-        from ...crud.test_case import regenerate_test_case_script
         try:
             await regenerate_test_case_script(db, str(updated_step.test_case_id))
         except Exception as e:
             # Log error but don't fail the step update
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Failed to regenerate test case file after updating step: {str(e)}")
     
     return updated_step
@@ -237,24 +228,18 @@ async def delete_step(
     
     # Auto-regenerate fixture file if step belonged to a fixture
     if fixture_id:
-        from ...crud.fixture import regenerate_fixture_with_steps
         try:
             await regenerate_fixture_with_steps(db, str(fixture_id))
         except Exception as e:
             # Log error but don't fail the step deletion
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Failed to regenerate fixture file after deleting step: {str(e)}")
     
     # Auto-regenerate test case file if step belonged to a test case
     if test_case_id:
-        from ...crud.test_case import regenerate_test_case_script
         try:
             await regenerate_test_case_script(db, str(test_case_id))
         except Exception as e:
             # Log error but don't fail the step deletion
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Failed to regenerate test case file after deleting step: {str(e)}")
     
     return {"message": "Step deleted successfully"}
@@ -483,6 +483,22 @@ def add_fixture_to_test_case(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/{test_case_id}/fixtures/bulk", response_model=List[dict], status_code=status.HTTP_201_CREATED)
+def add_fixtures_to_test_case(
+    test_case_id: str,
+    fixtures_data: List[TestCaseFixtureCreate],
+    current_user: User = Depends(current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Add several fixtures to a test case in one call"""
+    try:
+        return crud_test_case.add_fixtures_to_test_case(
+            db, test_case_id, fixtures_data, str(current_user.id)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.delete("/{test_case_id}/fixtures/{fixture_id}")
 def remove_fixture_from_test_case(
     test_case_id: str,
@@ -1010,6 +1026,7 @@ async def run_multiple_test_cases(
         # Run tests
         results = []
         errors = []
+        recorded_runs = []
         
         if parallel:
             # Run tests in parallel using asyncio
@@ -1033,9 +1050,9 @@ async def run_multiple_test_cases(
                         settings=run_settings
                     )
                     
-                    # Create test result records
+                    # Recorded together once every test has finished
                     if result.get('success'):
-                        await _create_test_result_records(db, project.id, test_case, result, request)
+                        recorded_runs.append((test_case, result))
                     
                     return {
                         "test_case_id": str(test_case.id),
@@ -1081,9 +1098,9 @@ async def run_multiple_test_cases(
                         settings=run_settings
                     )
                     
-                    # Create test result records
+                    # Recorded together once every test has finished
                     if result.get('success'):
-                        await _create_test_result_records(db, project.id, test_case, result, request)
+                        recorded_runs.append((test_case, result))
                     
                     results.append({
                         "test_case_id": str(test_case.id),
@@ -1098,6 +1115,9 @@ async def run_multiple_test_cases(
                         "error": str(e)
                     })
         
+        # Store the result records of all successful runs in one batch
+        await _create_test_result_records(db, project.id, recorded_runs, request)
+        
         # Calculate summary
         successful = len([r for r in results if r.get('success')])
         failed = len(results) - successful + len(errors)
@@ -1285,10 +1305,13 @@ async def run_project_test_cases_filtered(
         )
 
 
-async def _create_test_result_records(db: Session, project_id: str, test_case: TestCase, result: dict, request: Request):
-    """Helper function to create test result records"""
+async def _create_test_result_records(db: Session, project_id: str, runs: List[tuple], request: Request):
+    """Helper function to create test result records for a batch of (test_case, result) runs"""
+    if not runs:
+        return
     try:
-        from ...models.test_result import TestResultHistory, TestCaseExecution
+        from ...crud import test_result as crud_test_result
+        from ...schemas.test_result import TestResultHistoryCreate, TestCaseExecutionCreate
         
         # Get current user from request headers
         current_user_email = "system"
@@ -1303,27 +1326,6 @@ async def _create_test_result_records(db: Session, project_id: str, test_case: T
         except:
             pass
         
-        # Convert duration from ms to seconds
-        raw_duration_ms = result.get('duration', 0) or 0
-        duration_seconds = int(float(raw_duration_ms) / 1000)
-
-        # Create TestResultHistory for this run
-        test_result_history = TestResultHistory(
-            project_id=project_id,
-            name=f"Run {test_case.name}",
-            success=(result.get('status') == 'passed'),
-            status=result.get('status', 'completed'),
-            execution_time=duration_seconds,
-            output=result.get('output', ''),
-            error_message=result.get('error', ''),
-            created_by=current_user_email,
-            last_run_by=current_user_email
-        )
-        db.add(test_result_history)
-        db.commit()
-        db.refresh(test_result_history)
-        
-        # Create TestCaseExecution linked to this run
         from datetime import datetime, timezone
         def _to_dt(value):
             if value is None:
@@ -1337,22 +1339,42 @@ async def _create_test_result_records(db: Session, project_id: str, test_case: T
                 except Exception:
                     return None
         
-        start_time_dt = _to_dt(result.get('start_time'))
-        end_time_dt = _to_dt(result.get('end_time'))
-
-        test_execution = TestCaseExecution(
-            test_result_id=test_result_history.id,
-            test_case_id=str(test_case.id),
-            status=result.get('status', 'completed'),
-            duration=duration_seconds,
-            error_message=result.get('error', ''),
-            output=result.get('output', ''),
-            start_time=start_time_dt,
-            end_time=end_time_dt,
-            retries=0
-        )
-        db.add(test_execution)
-        db.commit()
+        def _duration_seconds(result):
+            # Convert duration from ms to seconds
+            raw_duration_ms = result.get('duration', 0) or 0
+            return int(float(raw_duration_ms) / 1000)
+        
+        # One TestResultHistory per run, inserted together; ids come back in run order
+        result_ids = crud_test_result.bulk_create_test_results(db, [
+            TestResultHistoryCreate(
+                project_id=project_id,
+                name=f"Run {test_case.name}",
+                success=(result.get('status') == 'passed'),
+                status=result.get('status', 'completed'),
+                execution_time=_duration_seconds(result),
+                output=result.get('output', ''),
+                error_message=result.get('error', ''),
+                created_by=current_user_email,
+                last_run_by=current_user_email
+            )
+            for test_case, result in runs
+        ])
+        
+        # Create the TestCaseExecution linked to each run
+        crud_test_result.bulk_create_test_case_executions(db, [
+            TestCaseExecutionCreate(
+                test_result_id=result_id,
+                test_case_id=test_case.id,
+                status=result.get('status', 'completed'),
+                duration=_duration_seconds(result),
+                error_message=result.get('error', ''),
+                output=result.get('output', ''),
+                start_time=_to_dt(result.get('start_time')),
+                end_time=_to_dt(result.get('end_time')),
+                retries=0
+            )
+            for result_id, (test_case, result) in zip(result_ids, runs)
+        ])
         
     except Exception as e:
         logger.error(f"Error creating test result records: {str(e)}")
@@ -1,15 +1,65 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Dict
+from typing import List, Dict, Iterator
 from datetime import datetime
 
-from ...database import get_db
+from ...database import get_db, get_session_local
 from ...schemas.test_result import TestResultHistory, TestCaseExecution
 from ...crud import test_result as crud_result
 
 router = APIRouter()
 
 
+def _json_array(documents: Iterator[str]) -> Iterator[str]:
+    """Wrap already-serialized JSON documents in a JSON array"""
+    yield "["
+    for index, document in enumerate(documents):
+        if index:
+            yield ","
+        yield document
+    yield "]"
+
+
+# The request-scoped session is closed before the body is streamed,
+# so each generator below owns its own session for the cursor lifetime.
+
+def _stream_test_results(skip: int, limit: int) -> Iterator[str]:
+    """Yield test results as a JSON array, one row at a time"""
+    db = get_session_local()()
+    try:
+        yield from _json_array(
+            TestResultHistory.model_validate(result).model_dump_json()
+            for result in crud_result.iter_test_results(db, skip=skip, limit=limit)
+        )
+    finally:
+        db.close()
+
+
+def _stream_project_test_results(project_id: str, skip: int, limit: int) -> Iterator[str]:
+    """Yield a project's test results as a JSON array, one row at a time"""
+    db = get_session_local()()
+    try:
+        yield from _json_array(
+            TestResultHistory.model_validate(result).model_dump_json()
+            for result in crud_result.iter_test_results_by_project(db, project_id=project_id, skip=skip, limit=limit)
+        )
+    finally:
+        db.close()
+
+
+def _stream_result_executions(result_id: str) -> Iterator[str]:
+    """Yield executions of a result as a JSON array, one row at a time"""
+    db = get_session_local()()
+    try:
+        yield from _json_array(
+            TestCaseExecution.model_validate(execution).model_dump_json()
+            for execution in crud_result.iter_executions_by_result(db, result_id=result_id)
+        )
+    finally:
+        db.close()
+
+
 # ============ VIEW TEST RESULTS (READ-ONLY) ============
 
 @router.get("/", response_model=List[TestResultHistory])
@@ -19,8 +69,10 @@ def get_test_results(
     db: Session = Depends(get_db)
 ):
     """Get all test results"""
-    results = crud_result.get_test_results(db, skip=skip, limit=limit)
-    return results
+    return StreamingResponse(
+        _stream_test_results(skip, limit),
+        media_type="application/json"
+    )
 
 
 @router.get("/{result_id}", response_model=TestResultHistory)
@@ -46,8 +98,10 @@ def get_result_executions(
     if result is None:
         raise HTTPException(status_code=404, detail="Test result not found")
     
-    executions = crud_result.get_executions_by_result(db, result_id=result_id)
-    return executions
+    return StreamingResponse(
+        _stream_result_executions(result_id),
+        media_type="application/json"
+    )
 
 
 @router.get("/executions/{execution_id}", response_model=TestCaseExecution)
@@ -72,8 +126,10 @@ def get_project_test_results(
     db: Session = Depends(get_db)
 ):
     """Get test results for a project"""
-    results = crud_result.get_test_results_by_project(db, project_id=project_id, skip=skip, limit=limit)
-    return results
+    return StreamingResponse(
+        _stream_project_test_results(project_id, skip, limit),
+        media_type="application/json"
+    )
 
 
 @router.get("/projects/{project_id}/results/latest", response_model=TestResultHistory)
@@ -181,26 +237,31 @@ def get_recent_test_runs(
     db: Session = Depends(get_db)
 ):
     """Get recent test runs analytics"""
-    recent_results = crud_result.get_test_results(db, skip=0, limit=50)
-    
-    # Convert recent_results to serializable dicts
+    total_runs = 0
+    successful_runs = 0
     recent_results_serializable = []
-    for result in recent_results[:10]:
-        recent_results_serializable.append({
-            "id": str(result.id),
-            "name": result.name,
-            "success": result.success,
-            "status": result.status,
-            "execution_time": result.execution_time,
-            "created_at": result.created_at.isoformat() if result.created_at else None,
-            "browser": result.browser,
-            "project_id": str(result.project_id)
-        })
+    
+    # Single streaming pass: count everything, serialize only the first 10
+    for result in crud_result.iter_test_results(db, skip=0, limit=50):
+        total_runs += 1
+        if result.success:
+            successful_runs += 1
+        if len(recent_results_serializable) < 10:
+            recent_results_serializable.append({
+                "id": str(result.id),
+                "name": result.name,
+                "success": result.success,
+                "status": result.status,
+                "execution_time": result.execution_time,
+                "created_at": result.created_at.isoformat() if result.created_at else None,
+                "browser": result.browser,
+                "project_id": str(result.project_id)
+            })
     
     analytics = {
-        "total_runs": len(recent_results),
-        "successful_runs": sum(1 for r in recent_results if r.success),
-        "failed_runs": sum(1 for r in recent_results if not r.success),
+        "total_runs": total_runs,
+        "successful_runs": successful_runs,
+        "failed_runs": total_runs - successful_runs,
         "recent_results": recent_results_serializable  # Use serializable dicts instead of raw models
     }
     
@@ -1,10 +1,11 @@
-from pydantic_settings import BaseSettings
-from pydantic import ConfigDict
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field
 from typing import Optional, Dict, Any
 import secrets
 import os
 import logging
 from pathlib import Path
+from functools import cached_property, lru_cache
 from urllib.parse import quote_plus
 
 logger = logging.getLogger(__name__)
@@ -12,20 +13,25 @@ logger = logging.getLogger(__name__)
 def load_env_file() -> Dict[str, str]:
     """Load .env file and return as dictionary"""
     env_vars = {}
+    # Explicit opt-out for deployments that inject the whole environment (e.g. Docker/K8s)
+    if os.environ.get("TESTMANAGER_SKIP_DOTENV"):
+        logger.info("Skipping .env file, TESTMANAGER_SKIP_DOTENV is set")
+        return env_vars
+    
     env_file = Path(__file__).parent.parent / ".env"
     
     if env_file.exists():
         logger.info(f"Loading .env file from: {env_file}")
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    # Remove quotes if present
-                    value = value.strip('"\'')
-                    env_vars[key] = value
-                    # Also set in os.environ for compatibility
-                    os.environ[key] = value
+        # Split raw bytes and decode only the keys/values that are kept
+        for line in env_file.read_bytes().splitlines():
+            key, sep, value = line.partition(b'=')
+            key = key.strip()
+            if not sep or not key or key.startswith(b'#'):
+                continue
+            # Remove quotes if present
+            env_vars[key.decode("utf-8")] = value.strip().strip(b'"\'').decode("utf-8")
+        # Also set in os.environ for compatibility
+        os.environ.update(env_vars)
         logger.info(f"Loaded {len(env_vars)} environment variables from .env")
     else:
         logger.warning(f".env file not found at: {env_file}")
@@ -44,8 +50,18 @@ class Settings(BaseSettings):
     db_name: str = "testmanager_db"
     db_driver: str = "postgresql"
     
-    # Computed database URL property
-    @property
+    # Connection pool settings for the sync engine
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 10  # seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # seconds before a connection is replaced
+    db_pool_pre_ping: bool = True
+    # psycopg2 executemany: "values_plus_batch" also pages UPDATE/DELETE batches
+    db_executemany_mode: str = "values_plus_batch"
+    db_executemany_batch_page_size: int = 500
+    
+    # Computed database URL, built once since credentials don't change at runtime
+    @cached_property
     def database_url(self) -> str:
         """Generate database URL with proper encoding of special characters"""
         # URL encode username and password to handle special characters
@@ -58,7 +74,7 @@ class Settings(BaseSettings):
     debug: bool = True
     
     # Security settings
-    secret_key: str = secrets.token_urlsafe(32)  # Generate secure key by default
+    secret_key: str = Field(default_factory=lambda: secrets.token_urlsafe(32))  # Generated only if not configured
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7  # New setting for refresh token expiration
@@ -85,16 +101,24 @@ class Settings(BaseSettings):
     ai_context_include_environment_info: bool = True
     ai_context_max_length: int = 2000  # Maximum context length to avoid token limits
     
-    model_config = ConfigDict(
+    model_config = SettingsConfigDict(
         env_file=".env",
+        env_file_encoding="utf-8",
         env_prefix="TESTMANAGER_",  # Environment variables should be prefixed with TESTMANAGER_
-        # Allow computed properties to work properly
-        computed_fields={'database_url'}
+        extra="ignore",
+        # Settings are constant for the process lifetime
+        frozen=True
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (usable with Depends)"""
+    return Settings()
+
+
 # Create settings instance - will automatically use loaded environment variables
-settings = Settings()
+settings = get_settings()
 
 # Log final configuration for debugging
 logger.info(f"✅ Configuration loaded:")
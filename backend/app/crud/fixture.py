@@ -1,23 +1,71 @@
-from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from sqlalchemy import and_, case, distinct, func, select, update
+from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List, Dict, Any
 from uuid import UUID
+import asyncio
 import logging
+import os
 from pathlib import Path
 
 from ..models.fixture import Fixture
-from ..models.user import User
+from ..models.project import Project
+from ..models.step import Step
+from ..models.test_case import TestCase
+from ..models.test_result import TestCaseExecution
+from ..models.versioning import FixtureVersion
+from .user import get_usernames_by_ids
 from ..schemas.fixture import FixtureCreate, FixtureUpdate
-from ..services.playwright_fixture import fixture_generator
+from ..services.playwright_project import playwright_manager
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import (we're in backend/app/crud)
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_PLAYWRIGHT_PROJECTS_DIR = _PROJECT_ROOT / "playwright_projects"
 
-def _read_fixture_file_content(fixture_file_path: str) -> Optional[str]:
+# Mapped fixture columns, used instead of per-row hasattr probes
+_FIXTURE_COLUMNS = frozenset(Fixture.__table__.columns.keys())
+
+
+# Relative fixture path -> resolved file; a plain dict so entries can be dropped one at a time
+_FIXTURE_PATH_CACHE: Dict[str, Path] = {}
+_FIXTURE_PATH_CACHE_SIZE = 2048
+
+
+def _resolve_fixture_path(fixture_file_path: str) -> Path:
+    """Find a relative fixture file in the playwright projects; misses raise and are not cached"""
+    cached = _FIXTURE_PATH_CACHE.get(fixture_file_path)
+    if cached is not None:
+        return cached
+    
+    # DirEntry caches its type, so directories are filtered without an extra stat
+    with os.scandir(_PLAYWRIGHT_PROJECTS_DIR) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                potential_file = Path(entry.path) / fixture_file_path
+                if potential_file.exists():
+                    if len(_FIXTURE_PATH_CACHE) >= _FIXTURE_PATH_CACHE_SIZE:
+                        # Evict the oldest entry (dicts keep insertion order)
+                        _FIXTURE_PATH_CACHE.pop(next(iter(_FIXTURE_PATH_CACHE)))
+                    _FIXTURE_PATH_CACHE[fixture_file_path] = potential_file
+                    return potential_file
+    raise FileNotFoundError(fixture_file_path)
+
+
+def _forget_fixture_path(fixture_file_path: Optional[str]) -> None:
+    """Drop a cached path resolution once the fixture file moves or goes away"""
+    if fixture_file_path:
+        _FIXTURE_PATH_CACHE.pop(fixture_file_path, None)
+
+
+def _read_fixture_file_content(fixture_file_path: str, project_name: Optional[str] = None) -> Optional[str]:
     """
     Read fixture file content from filesystem
     
     Args:
         fixture_file_path: Path to fixture file (can be absolute or relative)
+        project_name: Owning project, lets relative paths resolve with a single stat
         
     Returns:
         File content as string, or None if file not found/readable
@@ -30,27 +78,25 @@ def _read_fixture_file_content(fixture_file_path: str) -> Optional[str]:
         
         # If it's a relative path, make it absolute by joining with project root
         if not file_path.is_absolute():
-            # Get project root (assuming we're in backend/app/crud)
-            current_file = Path(__file__)
-            project_root = current_file.parent.parent.parent.parent  # Go up to project root
-            playwright_projects_dir = project_root / "playwright_projects"
-            
-            # Try to find the file in playwright_projects directory
             # fixture_file_path might be like "fixtures/loginAsAdmin.fixture.ts"
-            for project_dir in playwright_projects_dir.glob("*"):
-                if project_dir.is_dir():
-                    potential_file = project_dir / fixture_file_path
-                    if potential_file.exists():
-                        file_path = potential_file
-                        break
+            candidate = None
+            if project_name:
+                project_path = playwright_manager.get_project_path(project_name)
+                if project_path:
+                    candidate = project_path / fixture_file_path
+            
+            if candidate is not None and candidate.exists():
+                file_path = candidate
             else:
-                # If not found in any project, try as relative to project root
-                file_path = project_root / fixture_file_path
+                try:
+                    file_path = _resolve_fixture_path(fixture_file_path)
+                except FileNotFoundError:
+                    # If not found in any project, try as relative to project root
+                    file_path = _PROJECT_ROOT / fixture_file_path
         
         # Read file content
-        if file_path.exists() and file_path.is_file():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        if file_path.is_file():
+            content = file_path.read_text(encoding='utf-8')
             logger.info(f"Successfully read fixture file content: {file_path}")
             return content
         else:
@@ -62,115 +108,149 @@ def _read_fixture_file_content(fixture_file_path: str) -> Optional[str]:
         return None
 
 
+def _get_fixture_row(db: Session, fixture_id: str, with_project: bool = False) -> Optional[Fixture]:
+    """Fetch only the fixture row, without author/version enrichment"""
+    try:
+        # Identity map is keyed by UUID objects, so normalize before lookup
+        fixture_pk = UUID(str(fixture_id))
+    except ValueError:
+        return None
+    # Load the owning project in the same SELECT when requested
+    options = [joinedload(Fixture.project)] if with_project else None
+    return db.get(Fixture, fixture_pk, options=options)
+
+
+def fixture_exists(db: Session, fixture_id: str) -> bool:
+    """Check that a fixture exists with a SELECT EXISTS, without loading the row"""
+    try:
+        fixture_pk = UUID(str(fixture_id))
+    except ValueError:
+        return False
+    return db.query(db.query(Fixture.id).filter(Fixture.id == fixture_pk).exists()).scalar()
+
+
+def _latest_versions_subquery(db: Session, fixture_id: Optional[str] = None):
+    """Rank fixture versions newest-first per fixture; rn == 1 is the current version"""
+    
+    query = db.query(
+        FixtureVersion.fixture_id,
+        FixtureVersion.version,
+        func.row_number().over(
+            partition_by=FixtureVersion.fixture_id,
+            order_by=FixtureVersion.created_at.desc()
+        ).label('rn')
+    )
+    if fixture_id is not None:
+        query = query.filter(FixtureVersion.fixture_id == fixture_id)
+    return query.subquery()
+
+
 def get_fixture(db: Session, fixture_id: str) -> Optional[Fixture]:
-    fixture = db.query(Fixture).filter(Fixture.id == fixture_id).first()
-    
-    # Get author name if fixture exists
-    if fixture and fixture.created_by:
-        author = db.query(User.username).filter(User.id == fixture.created_by).first()
-        fixture.author_name = author[0] if author else None
-    elif fixture:
-        fixture.author_name = None
-    
-    # Get current version if fixture exists
-    if fixture:
-        from ..models.versioning import FixtureVersion
-        latest_version = db.query(FixtureVersion).filter(
-            FixtureVersion.fixture_id == fixture.id
-        ).order_by(FixtureVersion.created_at.desc()).first()
-        
-        if latest_version:
-            fixture.version = latest_version.version
-        else:
-            fixture.version = "1.0.0"  # Default version if no versions exist
+    # Latest version is joined into the fixture SELECT; the author is looked up separately
+    latest = _latest_versions_subquery(db, fixture_id)
+    row = (
+        db.query(Fixture)
+        .outerjoin(latest, and_(latest.c.fixture_id == Fixture.id, latest.c.rn == 1))
+        .add_columns(func.coalesce(latest.c.version, "1.0.0"))  # Default version if no versions exist
+        .filter(Fixture.id == fixture_id)
+        .first()
+    )
+    if not row:
+        return None
+    
+    fixture, version = row
+    fixture.author_name = get_usernames_by_ids(db, [fixture.created_by]).get(str(fixture.created_by))
+    fixture.version = version
     
     # Set default values for fields that may not exist in the database
-    if fixture:
-        if not hasattr(fixture, 'status') or fixture.status is None:
-            fixture.status = "draft"
-        if not hasattr(fixture, 'environment') or fixture.environment is None:
-            fixture.environment = "all"
+    if 'status' in _FIXTURE_COLUMNS and fixture.status is None:
+        fixture.status = "draft"
+    if 'environment' in _FIXTURE_COLUMNS and fixture.environment is None:
+        fixture.environment = "all"
     
     return fixture
 
 
-def get_fixtures(db: Session, skip: int = 0, limit: int = 100) -> List[Fixture]:
-    fixtures = (
-        db.query(Fixture)
+# Columns needed by list views; playwright_script stays out since it can be large
+_FIXTURE_SUMMARY_COLUMNS = (
+    Fixture.id,
+    Fixture.project_id,
+    Fixture.name,
+    Fixture.type,
+    # Defaults for fields that may be NULL in older rows
+    func.coalesce(Fixture.status, "draft").label("status"),
+    func.coalesce(Fixture.environment, "all").label("environment"),
+    Fixture.filename,
+    Fixture.export_name,
+    Fixture.fixture_file_path,
+    Fixture.created_by,
+    Fixture.updated_by,
+    Fixture.created_at,
+    Fixture.updated_at,
+)
+
+
+def _fixture_summaries(db: Session):
+    """Query fixture list columns"""
+    return db.query(*_FIXTURE_SUMMARY_COLUMNS)
+
+
+def _with_author_names(db: Session, rows) -> List[Dict[str, Any]]:
+    """Turn summary rows into dicts with author_name, resolving all authors in one IN query"""
+    authors = get_usernames_by_ids(db, (row.created_by for row in rows))
+    return [
+        {**row._asdict(), "author_name": authors.get(str(row.created_by)) if row.created_by else None}
+        for row in rows
+    ]
+
+
+def get_fixtures(db: Session, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+    rows = (
+        _fixture_summaries(db)
         .offset(skip)
         .limit(limit)
         .all()
     )
-    
-    # Get author names in a separate query
-    for fixture in fixtures:
-        if fixture.created_by:
-            author = db.query(User.username).filter(User.id == fixture.created_by).first()
-            fixture.author_name = author[0] if author else None
-        else:
-            fixture.author_name = None
-        
-        # Set default values for fields that may not exist in the database
-        if not hasattr(fixture, 'status') or fixture.status is None:
-            fixture.status = "draft"
-        if not hasattr(fixture, 'environment') or fixture.environment is None:
-            fixture.environment = "all"
-    
-    return fixtures
+    return _with_author_names(db, rows)
 
 
-def get_fixtures_by_project(db: Session, project_id: str, skip: int = 0, limit: int = 100) -> List[Fixture]:
-    import logging
-    from fastapi import HTTPException
-    logger = logging.getLogger(__name__)
+def _looks_like_uuid(value: str) -> bool:
+    """Cheap syntactic UUID check; the DB type adapter does the full validation"""
+    return len(value) == 36 and value.count('-') == 4
+
+
+def get_fixtures_by_project(db: Session, project_id: str, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+    
+    if not _looks_like_uuid(str(project_id)):
+        logger.error("Invalid UUID format: %s", project_id)
+        raise HTTPException(status_code=400, detail=f"Invalid project ID format: {project_id}")
     
     try:
-        # Convert string to UUID
-        
         logger.debug("Executing database query")
-        # Query fixtures first
-        fixtures = (
-            db.query(Fixture)
+        rows = (
+            _fixture_summaries(db)
             .filter(Fixture.project_id == project_id)
             .offset(skip)
             .limit(limit)
             .all()
         )
-        logger.debug(f"Query returned {len(fixtures)} results")
-        
-        # Then get author names in a separate query
-        for fixture in fixtures:
-            if fixture.created_by:
-                author = db.query(User.username).filter(User.id == fixture.created_by).first()
-                fixture.author_name = author[0] if author else None
-            else:
-                fixture.author_name = None
-            
-            # Set default values for fields that may not exist in the database
-            if not hasattr(fixture, 'status') or fixture.status is None:
-                fixture.status = "draft"
-            if not hasattr(fixture, 'environment') or fixture.environment is None:
-                fixture.environment = "all"
+        logger.debug("Query returned %d results", len(rows))
         
-        logger.debug(f"Processed {len(fixtures)} fixtures")
-        return fixtures
+        return _with_author_names(db, rows)
     except ValueError as e:
-        logger.error(f"Invalid UUID format: {project_id}")
-        logger.error(f"Error: {str(e)}")
+        logger.error("Invalid UUID format: %s (%s)", project_id, e)
         raise HTTPException(status_code=400, detail=f"Invalid project ID format: {project_id}")
     except Exception as e:
-        logger.error(f"Error getting fixtures for project {project_id}")
-        logger.error(f"Error: {str(e)}")
+        logger.error("Error getting fixtures for project %s: %s", project_id, e)
         raise
 
 
 async def create_fixture(db: Session, fixture: FixtureCreate) -> Fixture:
-    from ..models.project import Project
-    from fastapi import HTTPException
+    from ..services.playwright_fixture import fixture_generator
     
-    # Check if project exists
-    project = db.query(Project).filter(Project.id == fixture.project_id).first()
-    if not project:
+    # Check if project exists; only the name is needed for file generation
+    project_name = db.query(Project.name).filter(Project.id == fixture.project_id).scalar()
+    if project_name is None:
         raise HTTPException(status_code=404, detail="Project not found")
     
     logger.info(f"Creating fixture with created_by: {fixture.created_by}")
@@ -185,52 +265,51 @@ async def create_fixture(db: Session, fixture: FixtureCreate) -> Fixture:
     )
     
     # Set optional fields if they exist in the model
-    if hasattr(db_fixture, 'status'):
+    if 'status' in _FIXTURE_COLUMNS:
         db_fixture.status = fixture.status
-    if hasattr(db_fixture, 'environment'):
+    if 'environment' in _FIXTURE_COLUMNS:
         db_fixture.environment = fixture.environment
     
+    # Committed once below, together with the generated file information
     db.add(db_fixture)
-    db.commit()
-    db.refresh(db_fixture)
     
     # Generate and save fixture file to local project
     try:
-        # Generate fixture file using the template
-        fixture_result = fixture_generator.generate_fixture(
+        # Generate fixture file using the template (off the event loop)
+        fixture_result = await asyncio.to_thread(
+            fixture_generator.generate_fixture,
             name=fixture.name,
             fixture_type=fixture.type,
             content=fixture.playwright_script or "// Add your fixture code here",
-            description=f"Fixture for {project.name}"
+            description=f"Fixture for {project_name}"
         )
         
         if fixture_result['success']:
             # Save to local project
-            save_result = fixture_generator.save_fixture_to_project(
-                project_name=project.name,
+            save_result = await asyncio.to_thread(
+                fixture_generator.save_fixture_to_project,
+                project_name=project_name,
                 fixture_result=fixture_result
             )
             
             if save_result['success']:
                 # Update database with file information if fields exist
-                if hasattr(db_fixture, 'filename'):
+                if 'filename' in _FIXTURE_COLUMNS:
                     db_fixture.filename = fixture_result['filename']
-                if hasattr(db_fixture, 'export_name'):
+                if 'export_name' in _FIXTURE_COLUMNS:
                     db_fixture.export_name = fixture_result['export_name']
-                if hasattr(db_fixture, 'fixture_file_path'):
+                if 'fixture_file_path' in _FIXTURE_COLUMNS:
                     db_fixture.fixture_file_path = save_result['file_path']
                 
-                # Read the generated file content and save to playwright_script
-                file_content = _read_fixture_file_content(save_result['file_path'])
+                # Store the content that was just written instead of reading the file back
+                file_content = fixture_result.get('content')
+                if file_content is None:
+                    file_content = await asyncio.to_thread(_read_fixture_file_content, save_result['file_path'], project_name)
                 if file_content:
                     db_fixture.playwright_script = file_content
-                    logger.info(f"Successfully read and saved fixture file content to database")
                 else:
                     logger.warning(f"Could not read fixture file content from: {save_result['file_path']}")
                 
-                db.commit()
-                db.refresh(db_fixture)
-                
                 logger.info(f"Successfully created fixture file: {save_result['file_path']}")
             else:
                 logger.warning(f"Failed to save fixture file: {save_result.get('error')}")
@@ -241,31 +320,45 @@ async def create_fixture(db: Session, fixture: FixtureCreate) -> Fixture:
         logger.error(f"Error creating fixture file: {str(e)}")
         # Don't fail the database creation if file generation fails
     
+    db.commit()
     return db_fixture
 
 
-def update_fixture(db: Session, fixture_id: str, fixture: FixtureUpdate, updated_by: str = None) -> Optional[Fixture]:
-    db_fixture = get_fixture(db, fixture_id)
+async def update_fixture(db: Session, fixture_id: str, fixture: FixtureUpdate, updated_by: str = None) -> Optional[Fixture]:
+    update_data = fixture.dict(exclude_unset=True)
+    
+    # No file regeneration needed: issue a single UPDATE ... RETURNING
+    if 'playwright_script' not in update_data:
+        values = {'updated_by': updated_by} if updated_by else {}
+        values.update((field, value) for field, value in update_data.items() if field in _FIXTURE_COLUMNS)
+        if not values:
+            return _get_fixture_row(db, fixture_id)
+        db_fixture = db.scalars(
+            update(Fixture).where(Fixture.id == fixture_id).values(**values).returning(Fixture)
+        ).first()
+        db.commit()
+        return db_fixture
+    
+    db_fixture = _get_fixture_row(db, fixture_id, with_project=True)
     if db_fixture:
-        update_data = fixture.dict(exclude_unset=True)
-        
         # Set updated_by if provided and the field exists
-        if updated_by and hasattr(db_fixture, 'updated_by'):
+        if updated_by and 'updated_by' in _FIXTURE_COLUMNS:
             db_fixture.updated_by = updated_by
         
         # Update other fields that exist
         for field, value in update_data.items():
-            if hasattr(db_fixture, field):
+            if field in _FIXTURE_COLUMNS:
                 setattr(db_fixture, field, value)
         
         # Update fixture file if playwright_script changed
         if 'playwright_script' in update_data and db_fixture.project_id:
             try:
-                from ..models.project import Project
-                project = db.query(Project).filter(Project.id == db_fixture.project_id).first()
+                from ..services.playwright_fixture import fixture_generator
+                project = db_fixture.project
                 if project:
                     # Regenerate fixture file
-                    fixture_result = fixture_generator.generate_fixture(
+                    fixture_result = await asyncio.to_thread(
+                        fixture_generator.generate_fixture,
                         name=db_fixture.name,
                         fixture_type=db_fixture.type,
                         content=db_fixture.playwright_script or "// Add your fixture code here",
@@ -274,25 +367,29 @@ def update_fixture(db: Session, fixture_id: str, fixture: FixtureUpdate, updated
                     
                     if fixture_result['success']:
                         # Save to local project
-                        save_result = fixture_generator.save_fixture_to_project(
+                        save_result = await asyncio.to_thread(
+                            fixture_generator.save_fixture_to_project,
                             project_name=project.name,
                             fixture_result=fixture_result
                         )
                         
                         if save_result['success']:
                             # Update database with file information if fields exist
-                            if hasattr(db_fixture, 'filename'):
+                            if 'filename' in _FIXTURE_COLUMNS:
                                 db_fixture.filename = fixture_result['filename']
-                            if hasattr(db_fixture, 'export_name'):
+                            if 'export_name' in _FIXTURE_COLUMNS:
                                 db_fixture.export_name = fixture_result['export_name']
-                            if hasattr(db_fixture, 'fixture_file_path'):
+                            if 'fixture_file_path' in _FIXTURE_COLUMNS:
+                                # A renamed fixture lands in a new file
+                                _forget_fixture_path(db_fixture.fixture_file_path)
                                 db_fixture.fixture_file_path = save_result['file_path']
                             
-                            # Read the updated file content and save to playwright_script
-                            file_content = _read_fixture_file_content(save_result['file_path'])
+                            # Store the content that was just written instead of reading the file back
+                            file_content = fixture_result.get('content')
+                            if file_content is None:
+                                file_content = await asyncio.to_thread(_read_fixture_file_content, save_result['file_path'], project.name)
                             if file_content:
                                 db_fixture.playwright_script = file_content
-                                logger.info(f"Successfully read and updated fixture file content in database")
                             else:
                                 logger.warning(f"Could not read updated fixture file content from: {save_result['file_path']}")
                             
@@ -307,107 +404,13 @@ def update_fixture(db: Session, fixture_id: str, fixture: FixtureUpdate, updated
                 # Don't fail the database update if file generation fails
         
         db.commit()
-        db.refresh(db_fixture)
     return db_fixture
 
 
-async def regenerate_fixture_with_steps(db: Session, fixture_id: str) -> bool:
-    """
-    Regenerate fixture file with current steps and update playwright_script in database
-    
-    Args:
-        db: Database session
-        fixture_id: Fixture ID to regenerate
-        
-    Returns:
-        True if successful, False otherwise
-    """
-    try:
-        # Get fixture
-        db_fixture = get_fixture(db, fixture_id)
-        if not db_fixture:
-            logger.error(f"Fixture not found: {fixture_id}")
-            return False
-        
-        # Get project
-        from ..models.project import Project
-        project = db.query(Project).filter(Project.id == db_fixture.project_id).first()
-        if not project:
-            logger.error(f"Project not found for fixture: {fixture_id}")
-            return False
-        
-        # Get fixture steps to include in regeneration
-        from .step import get_fixture_steps
-        steps = get_fixture_steps(db, fixture_id)
-        
-        # Build fixture content with steps
-        fixture_content = db_fixture.playwright_script or "// Add your fixture code here"
-        
-        # If we have steps, add them as comments or code blocks
-        if steps:
-            fixture_content += "\n\n// Steps for this fixture:\n"
-            for step in sorted(steps, key=lambda x: x.order):
-                fixture_content += f"// Step {step.order}: {step.action}\n"
-                if step.data:
-                    fixture_content += f"//   Data: {step.data}\n"
-                if step.expected:
-                    fixture_content += f"//   Expected: {step.expected}\n"
-                if step.playwright_script:
-                    fixture_content += f"//   Script:\n//   {step.playwright_script.replace(chr(10), chr(10) + '//   ')}\n"
-                fixture_content += "\n"
-        
-        # Generate fixture file using the template
-        fixture_result = fixture_generator.generate_fixture(
-            name=db_fixture.name,
-            fixture_type=db_fixture.type,
-            content=fixture_content,
-            description=f"Fixture for {project.name} (regenerated with steps)"
-        )
-        
-        if not fixture_result['success']:
-            logger.error(f"Failed to generate fixture file: {fixture_result.get('error')}")
-            return False
-        
-        # Save to local project
-        save_result = fixture_generator.save_fixture_to_project(
-            project_name=project.name,
-            fixture_result=fixture_result
-        )
-        
-        if not save_result['success']:
-            logger.error(f"Failed to save fixture file: {save_result.get('error')}")
-            return False
-        
-        # Update database with file information
-        if hasattr(db_fixture, 'filename'):
-            db_fixture.filename = fixture_result['filename']
-        if hasattr(db_fixture, 'export_name'):
-            db_fixture.export_name = fixture_result['export_name']
-        if hasattr(db_fixture, 'fixture_file_path'):
-            db_fixture.fixture_file_path = save_result['file_path']
-        
-        # Read the regenerated file content and save to playwright_script
-        file_content = _read_fixture_file_content(save_result['file_path'])
-        if file_content:
-            db_fixture.playwright_script = file_content
-            logger.info(f"Successfully regenerated fixture file and updated content in database")
-        else:
-            logger.warning(f"Could not read regenerated fixture file content from: {save_result['file_path']}")
-        
-        db.commit()
-        db.refresh(db_fixture)
-        
-        logger.info(f"Successfully regenerated fixture file: {save_result['file_path']}")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error regenerating fixture file: {str(e)}")
-        return False
-
-
 def delete_fixture(db: Session, fixture_id: str) -> bool:
-    db_fixture = get_fixture(db, fixture_id)
+    db_fixture = _get_fixture_row(db, fixture_id)
     if db_fixture:
+        _forget_fixture_path(db_fixture.fixture_file_path)
         db.delete(db_fixture)
         db.commit()
         return True
@@ -416,39 +419,31 @@ def delete_fixture(db: Session, fixture_id: str) -> bool:
 
 async def regenerate_fixture_with_steps(db: Session, fixture_id: str) -> bool:
     """Regenerate fixture file including all steps"""
-    from ..models.project import Project
-    from ..crud.step import get_steps_by_fixture
+    from ..services.playwright_fixture import fixture_generator
     
-    # Get fixture
-    fixture = get_fixture(db, fixture_id)
+    # Get fixture together with its project
+    fixture = _get_fixture_row(db, fixture_id, with_project=True)
     if not fixture:
         return False
     
-    # Get project
-    project = db.query(Project).filter(Project.id == fixture.project_id).first()
+    project = fixture.project
     if not project:
         return False
     
-    # Get steps
-    steps = get_steps_by_fixture(db, fixture_id)
-    
-    # Convert steps to dict format for template
-    steps_data = []
-    for step in steps:
-        steps_data.append({
-            'order': step.order,
-            'action': step.action,
-            'playwright_script': step.playwright_script,
-            'expected': step.expected,
-            'data': step.data
-        })
-    
-    # Sort steps by order
-    steps_data.sort(key=lambda x: x['order'])
+    # Get steps already sorted by the database, as plain dicts for the template
+    steps_data = [
+        row._asdict()
+        for row in db.query(
+            Step.order, Step.action, Step.playwright_script, Step.expected, Step.data
+        ).filter(
+            Step.referenced_fixture_id == fixture_id
+        ).order_by(Step.order)
+    ]
     
     try:
         # Generate fixture file with steps
-        fixture_result = fixture_generator.generate_fixture(
+        fixture_result = await asyncio.to_thread(
+            fixture_generator.generate_fixture,
             name=fixture.name,
             fixture_type=fixture.type,
             content=fixture.playwright_script or "// Add your fixture code here",
@@ -458,7 +453,8 @@ async def regenerate_fixture_with_steps(db: Session, fixture_id: str) -> bool:
         
         if fixture_result['success']:
             # Save to local project
-            save_result = fixture_generator.save_fixture_to_project(
+            save_result = await asyncio.to_thread(
+                fixture_generator.save_fixture_to_project,
                 project_name=project.name,
                 fixture_result=fixture_result
             )
@@ -467,10 +463,12 @@ async def regenerate_fixture_with_steps(db: Session, fixture_id: str) -> bool:
                 # Update database with file information
                 fixture.filename = fixture_result['filename']
                 fixture.export_name = fixture_result['export_name']
+                _forget_fixture_path(fixture.fixture_file_path)
                 fixture.fixture_file_path = save_result['file_path']
                 
+                # playwright_script stays the user-authored body: the rendered file wraps it,
+                # so storing the file here would nest it again on the next regeneration
                 db.commit()
-                db.refresh(fixture)
                 
                 logger.info(f"Successfully regenerated fixture file with steps: {save_result['file_path']}")
                 return True
@@ -487,19 +485,19 @@ async def regenerate_fixture_with_steps(db: Session, fixture_id: str) -> bool:
 
 def get_fixture_detail(db: Session, fixture_id: str) -> Optional[Dict[str, Any]]:
     """Get fixture detail with test cases information"""
-    from ..models.step import Step
-    from ..models.test_case import TestCase
     
     fixture = get_fixture(db, fixture_id)
     if not fixture:
         return None
     
-    # Get test cases that use this fixture through steps
-    test_cases_using_fixture = db.query(TestCase).join(
-        Step, Step.test_case_id == TestCase.id
+    # Get test cases that use this fixture through steps; IN avoids the join-then-DISTINCT
+    test_cases_using_fixture = db.query(
+        TestCase.id, TestCase.name, TestCase.status, TestCase.created_at
     ).filter(
-        Step.referenced_fixture_id == fixture_id
-    ).distinct().all()
+        TestCase.id.in_(
+            select(Step.test_case_id).where(Step.referenced_fixture_id == fixture_id)
+        )
+    ).all()
     
     test_cases_count = len(test_cases_using_fixture)
     
@@ -541,28 +539,33 @@ def get_fixture_detail(db: Session, fixture_id: str) -> Optional[Dict[str, Any]]
 
 def get_fixture_execution_statistics(db: Session, fixture_id: str) -> Dict[str, Any]:
     """Get execution statistics for a fixture"""
-    from ..models.step import Step
-    from ..models.test_result import TestCaseExecution
-    from ..models.test_case import TestCase
-    from sqlalchemy import func
-    
-    # Get total test cases that use this fixture
-    test_cases_using_fixture = db.query(TestCase).join(
-        Step, Step.test_case_id == TestCase.id
-    ).filter(
-        Step.referenced_fixture_id == fixture_id
-    ).distinct().count()
-    
-    # Get executions for test cases that use this fixture
-    executions_query = db.query(TestCaseExecution).join(
-        TestCase, TestCaseExecution.test_case_id == TestCase.id
-    ).join(
-        Step, Step.test_case_id == TestCase.id
-    ).filter(
-        Step.referenced_fixture_id == fixture_id
+    
+    # Test cases that call this fixture through one of their steps
+    using_test_cases = select(Step.test_case_id).where(Step.referenced_fixture_id == fixture_id)
+    
+    test_cases_used = (
+        select(func.count(distinct(Step.test_case_id)))
+        .where(Step.referenced_fixture_id == fixture_id)
+        .scalar_subquery()
+    )
+    last_status = (
+        select(TestCaseExecution.status)
+        .where(TestCaseExecution.test_case_id.in_(using_test_cases))
+        .order_by(TestCaseExecution.created_at.desc())
+        .limit(1)
+        .scalar_subquery()
     )
     
-    total_executions = executions_query.count()
+    # All figures are computed in a single round-trip
+    total_executions, successful_executions, avg_duration, last_status, test_cases_using_fixture = db.query(
+        func.count(TestCaseExecution.id),
+        func.coalesce(func.sum(case((TestCaseExecution.status == "passed", 1), else_=0)), 0),
+        func.avg(TestCaseExecution.duration),
+        last_status,
+        test_cases_used
+    ).filter(
+        TestCaseExecution.test_case_id.in_(using_test_cases)
+    ).one()
     
     if total_executions == 0:
         return {
@@ -573,28 +576,12 @@ def get_fixture_execution_statistics(db: Session, fixture_id: str) -> Dict[str,
             "last_status": "not-run"
         }
     
-    # Calculate success rate
-    successful_executions = executions_query.filter(
-        TestCaseExecution.status == "passed"
-    ).count()
-    success_rate = (successful_executions / total_executions) * 100 if total_executions > 0 else 0
-    
-    # Calculate average duration
-    avg_duration_result = executions_query.with_entities(
-        func.avg(TestCaseExecution.duration)
-    ).scalar()
-    avg_duration = int(avg_duration_result) if avg_duration_result else 0
-    
-    # Get last execution status
-    last_execution = executions_query.order_by(
-        TestCaseExecution.created_at.desc()
-    ).first()
-    last_status = last_execution.status if last_execution else "not-run"
+    success_rate = (successful_executions / total_executions) * 100
     
     return {
         "total_executions": total_executions,
         "total_test_cases_used": test_cases_using_fixture,
         "success_rate": round(success_rate, 2),
-        "avg_duration": avg_duration,
-        "last_status": last_status
-    } 
\ No newline at end of file
+        "avg_duration": int(avg_duration) if avg_duration else 0,
+        "last_status": last_status or "not-run"
+    }
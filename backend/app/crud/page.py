@@ -1,12 +1,65 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.orm import Session, joinedload
+from typing import Iterable, List, Optional
+from uuid import UUID
+import logging
 
 from ..models.page import Page as PageModel
 from ..models.page_element import PageLocator as PageLocatorModel
-from ..models.user import User
 from ..models.project import Project as ProjectModel
+from .user import get_usernames_by_ids
 from ..schemas.page import PageCreate, PageUpdate, PageLocatorCreate, PageLocatorUpdate
-from ..services.page_generator import generate_page_object_for_project
+from ..services.page_generator import schedule_page_object_generation
+from ..services.playwright_project import playwright_manager
+
+logger = logging.getLogger(__name__)
+
+
+def _attach_author_names(db: Session, items: Iterable) -> None:
+    """Set author_name on each item, resolving all authors in one query"""
+    authors = get_usernames_by_ids(db, (item.created_by for item in items))
+    for item in items:
+        if item.created_by:
+            item.author_name = authors.get(str(item.created_by))
+
+
+def _generate_page_object(project_id: str, playwright_project_path: Optional[str]) -> None:
+    """Schedule regeneration of the project's page object file; failures are logged, not raised"""
+    try:
+        if playwright_project_path:
+            # Resolve folder name to absolute path using project manager
+            abs_path = str(playwright_manager.get_project_path(playwright_project_path))
+            # Debounced per project, so a burst of locator edits rewrites the file once
+            schedule_page_object_generation(project_id, abs_path)
+    except Exception:
+        logger.exception("Failed to generate page object")
+
+
+def _get_by_pk(db: Session, model, row_id: str, options=None):
+    """Primary-key lookup through the identity map; rows already loaded in this session cost no SELECT"""
+    try:
+        # Identity map is keyed by UUID objects, so normalize before lookup
+        pk = UUID(str(row_id))
+    except ValueError:
+        return None
+    return db.get(model, pk, options=options)
+
+
+def _get_page_raw(db: Session, page_id: str) -> Optional[PageModel]:
+    """Fetch a page without the author lookup"""
+    return _get_by_pk(db, PageModel, page_id)
+
+
+def _get_project_path(db: Session, project_id) -> Optional[str]:
+    """Read only the project's Playwright folder, without loading the Project row"""
+    return db.query(ProjectModel.playwright_project_path).filter(ProjectModel.id == project_id).scalar()
+
+
+def _get_locator_with_project(db: Session, locator_id: str) -> Optional[PageLocatorModel]:
+    """Fetch a locator with its page and project in a single SELECT"""
+    return _get_by_pk(
+        db, PageLocatorModel, locator_id,
+        options=[joinedload(PageLocatorModel.page).joinedload(PageModel.project)]
+    )
 
 
 def create_page(db: Session, page: PageCreate, created_by: Optional[str] = None) -> PageModel:
@@ -16,36 +69,23 @@ def create_page(db: Session, page: PageCreate, created_by: Optional[str] = None)
     db_page = PageModel(**page_data)
     db.add(db_page)
     db.commit()
-    db.refresh(db_page)
     
     # Generate page object file
-    try:
-        project = db.query(ProjectModel).filter(ProjectModel.id == page.project_id).first()
-        if project and project.playwright_project_path:
-            # Resolve folder name to absolute path using project manager
-            from ..services.playwright_project import playwright_manager
-            abs_path = str(playwright_manager.get_project_path(project.playwright_project_path))
-            generate_page_object_for_project(db, str(page.project_id), abs_path)
-    except Exception as e:
-        print(f"Failed to generate page object: {e}")
+    _generate_page_object(str(page.project_id), _get_project_path(db, page.project_id))
     
     return db_page
 
 
 def get_page(db: Session, page_id: str) -> Optional[PageModel]:
-    page = db.query(PageModel).filter(PageModel.id == page_id).first()
-    if page and page.created_by:
-        author = db.query(User.username).filter(User.id == page.created_by).first()
-        page.author_name = author[0] if author else None
+    page = _get_page_raw(db, page_id)
+    if page:
+        _attach_author_names(db, [page])
     return page
 
 
 def get_pages(db: Session, skip: int = 0, limit: int = 100) -> List[PageModel]:
     pages = db.query(PageModel).offset(skip).limit(limit).all()
-    for p in pages:
-        if p.created_by:
-            author = db.query(User.username).filter(User.id == p.created_by).first()
-            p.author_name = author[0] if author else None
+    _attach_author_names(db, pages)
     return pages
 
 
@@ -58,57 +98,42 @@ def get_pages_by_project(db: Session, project_id: str, skip: int = 0, limit: int
         .limit(limit)
         .all()
     )
-    for p in pages:
-        if p.created_by:
-            author = db.query(User.username).filter(User.id == p.created_by).first()
-            p.author_name = author[0] if author else None
+    _attach_author_names(db, pages)
     return pages
 
 
 def update_page(db: Session, page_id: str, page: PageUpdate, updated_by: Optional[str] = None) -> Optional[PageModel]:
-    db_page = get_page(db, page_id)
+    # Endpoints have usually loaded the page already, so this is an identity-map hit
+    db_page = _get_page_raw(db, page_id)
     if not db_page:
         return None
+    project_path = _get_project_path(db, db_page.project_id)
     update_data = page.model_dump(exclude_unset=True)
     if updated_by:
         update_data['updated_by'] = updated_by
     for field, value in update_data.items():
         setattr(db_page, field, value)
     db.commit()
-    db.refresh(db_page)
     
     # Generate page object file
-    try:
-        project = db.query(ProjectModel).filter(ProjectModel.id == db_page.project_id).first()
-        if project and project.playwright_project_path:
-            from ..services.playwright_project import playwright_manager
-            abs_path = str(playwright_manager.get_project_path(project.playwright_project_path))
-            generate_page_object_for_project(db, str(db_page.project_id), abs_path)
-    except Exception as e:
-        print(f"Failed to generate page object: {e}")
+    _generate_page_object(str(db_page.project_id), project_path)
     
     return db_page
 
 
 def delete_page(db: Session, page_id: str) -> bool:
-    db_page = get_page(db, page_id)
+    db_page = _get_page_raw(db, page_id)
     if not db_page:
         return False
     
     project_id = str(db_page.project_id)
-    project = db.query(ProjectModel).filter(ProjectModel.id == db_page.project_id).first()
+    project_path = _get_project_path(db, db_page.project_id)
     
     db.delete(db_page)
     db.commit()
     
     # Generate page object file
-    try:
-        if project and project.playwright_project_path:
-            from ..services.playwright_project import playwright_manager
-            abs_path = str(playwright_manager.get_project_path(project.playwright_project_path))
-            generate_page_object_for_project(db, project_id, abs_path)
-    except Exception as e:
-        print(f"Failed to generate page object: {e}")
+    _generate_page_object(project_id, project_path)
     
     return True
 
@@ -121,29 +146,23 @@ def create_page_locator(db: Session, locator: PageLocatorCreate, created_by: Opt
     db_locator = PageLocatorModel(**locator_data)
     db.add(db_locator)
     db.commit()
-    db.refresh(db_locator)
     
-    # Generate page object file
-    try:
-        # Get the page first to get project_id
-        page = db.query(PageModel).filter(PageModel.id == locator.page_id).first()
-        if page:
-            project = db.query(ProjectModel).filter(ProjectModel.id == page.project_id).first()
-            if project and project.playwright_project_path:
-                from ..services.playwright_project import playwright_manager
-                abs_path = str(playwright_manager.get_project_path(project.playwright_project_path))
-                generate_page_object_for_project(db, str(page.project_id), abs_path)
-    except Exception as e:
-        print(f"Failed to generate page object: {e}")
-    
-    if db_locator.created_by:
-        author = db.query(User.username).filter(User.id == db_locator.created_by).first()
-        db_locator.author_name = author[0] if author else None
+    # Generate page object file; page and project come back in one joined SELECT
+    target = (
+        db.query(PageModel.project_id, ProjectModel.playwright_project_path)
+        .join(ProjectModel, ProjectModel.id == PageModel.project_id)
+        .filter(PageModel.id == locator.page_id)
+        .first()
+    )
+    if target:
+        _generate_page_object(str(target.project_id), target.playwright_project_path)
+    
+    _attach_author_names(db, [db_locator])
     return db_locator
 
 
 def get_page_locator(db: Session, locator_id: str) -> Optional[PageLocatorModel]:
-    return db.query(PageLocatorModel).filter(PageLocatorModel.id == locator_id).first()
+    return _get_by_pk(db, PageLocatorModel, locator_id)
 
 
 def get_page_locators_by_page(db: Session, page_id: str, skip: int = 0, limit: int = 100) -> list[PageLocatorModel]:
@@ -155,64 +174,48 @@ def get_page_locators_by_page(db: Session, page_id: str, skip: int = 0, limit: i
         .limit(limit)
         .all()
     )
-    for l in locators:
-        if l.created_by:
-            author = db.query(User.username).filter(User.id == l.created_by).first()
-            l.author_name = author[0] if author else None
+    _attach_author_names(db, locators)
     return locators
 
 
 def update_page_locator(db: Session, locator_id: str, locator: PageLocatorUpdate, updated_by: Optional[str] = None) -> Optional[PageLocatorModel]:
-    db_locator = get_page_locator(db, locator_id)
+    db_locator = _get_locator_with_project(db, locator_id)
     if not db_locator:
         return None
+    # Page and project come from the joined lookup, so these reads cost no query
+    page = db_locator.page
+    project_id = str(page.project_id) if page else None
+    project_path = page.project.playwright_project_path if page and page.project else None
     update_data = locator.model_dump(exclude_unset=True)
     if updated_by:
         update_data['updated_by'] = updated_by
     for field, value in update_data.items():
         setattr(db_locator, field, value)
     db.commit()
-    db.refresh(db_locator)
     
     # Generate page object file
-    try:
-        # Get the page first to get project_id
-        page = db.query(PageModel).filter(PageModel.id == db_locator.page_id).first()
-        if page:
-            project = db.query(ProjectModel).filter(ProjectModel.id == page.project_id).first()
-            if project and project.playwright_project_path:
-                from ..services.playwright_project import playwright_manager
-                abs_path = str(playwright_manager.get_project_path(project.playwright_project_path))
-                generate_page_object_for_project(db, str(page.project_id), abs_path)
-    except Exception as e:
-        print(f"Failed to generate page object: {e}")
-    
-    if db_locator.created_by:
-        author = db.query(User.username).filter(User.id == db_locator.created_by).first()
-        db_locator.author_name = author[0] if author else None
+    if project_id:
+        _generate_page_object(project_id, project_path)
+    
+    _attach_author_names(db, [db_locator])
     return db_locator
 
 
 def delete_page_locator(db: Session, locator_id: str) -> bool:
-    db_locator = get_page_locator(db, locator_id)
+    db_locator = _get_locator_with_project(db, locator_id)
     if not db_locator:
         return False
     
-    # Get the page first to get project_id
-    page = db.query(PageModel).filter(PageModel.id == db_locator.page_id).first()
+    page = db_locator.page
     project_id = str(page.project_id) if page else None
+    project_path = page.project.playwright_project_path if page and page.project else None
     
     db.delete(db_locator)
     db.commit()
     
     # Generate page object file
-    try:
-        if page and project_id:
-            project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-            if project and project.playwright_project_path:
-                generate_page_object_for_project(db, project_id, project.playwright_project_path)
-    except Exception as e:
-        print(f"Failed to generate page object: {e}")
+    if project_id:
+        _generate_page_object(project_id, project_path)
     
     return True
 
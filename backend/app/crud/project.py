@@ -1,11 +1,12 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert, select
 from typing import Optional, List
 from uuid import UUID
 import asyncio
 import logging
 
 from ..models.project import Project
+from ..models.project_member import ProjectMember
 from ..models.test_case import TestCase
 from ..models.fixture import Fixture
 from ..schemas.project import ProjectCreate, ProjectUpdate
@@ -43,15 +44,14 @@ async def _create_default_project_settings(db: Session, project_id: str, base_ur
         'VIDEO': 'off',
     }
     
-    # Create settings in database
-    for key, value in default_settings.items():
-        setting = ProjectSetting(
-            project_id=project_id,
-            key=key,
-            value=value,
-            created_by=created_by
-        )
-        db.add(setting)
+    # Create settings in database with one executemany INSERT
+    db.execute(
+        insert(ProjectSetting),
+        [
+            {"project_id": project_id, "key": key, "value": value, "created_by": created_by}
+            for key, value in default_settings.items()
+        ]
+    )
     
     db.commit()
     logger.info(f"Created default project settings for project {project_id}")
@@ -66,8 +66,14 @@ def get_projects(db: Session, skip: int = 0, limit: int = 100) -> List[Project]:
 
 
 def get_projects_by_user(db: Session, user_id: str, skip: int = 0, limit: int = 100) -> List[Project]:
-    # For now, return all projects. Later add permission filtering
-    return db.query(Project).offset(skip).limit(limit).all()
+    return (
+        db.query(Project)
+        .join(ProjectMember, ProjectMember.project_id == Project.id)
+        .filter(ProjectMember.user_id == user_id)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
 
 
 async def create_project(db: Session, project: ProjectCreate, created_by: str) -> Project:
@@ -80,8 +86,12 @@ async def create_project(db: Session, project: ProjectCreate, created_by: str) -
         updated_by=created_by
     )
     db.add(db_project)
+    db.flush()
+    
+    # The creator is the project's first member
+    if created_by:
+        db.add(ProjectMember(project_id=db_project.id, user_id=UUID(created_by), created_by=created_by))
     db.commit()
-    db.refresh(db_project)
     
     # Create default project settings including base_url and Playwright config
     await _create_default_project_settings(db, str(db_project.id), project.base_url, created_by)
@@ -104,7 +114,6 @@ async def create_project(db: Session, project: ProjectCreate, created_by: str) -
             logger.info(f"Set playwright_project_path (folder name): {cleaned_name}")
             
             # Build and replace playwright.config.ts with project settings using playwright_project service
-            from ..services.playwright_project import playwright_manager
             config_success = await playwright_manager.build_playwright_config(db, str(db_project.id), cleaned_name)
             if not config_success:
                 logger.warning(f"Failed to build playwright config for project '{cleaned_name}'")
@@ -124,7 +133,7 @@ def update_project(db: Session, project_id: UUID, project: ProjectUpdate, update
     if not db_project:
         return None
     
-    update_data = project.dict(exclude_unset=True)
+    update_data = project.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_project, field, value)
     
@@ -132,7 +141,6 @@ def update_project(db: Session, project_id: UUID, project: ProjectUpdate, update
         db_project.updated_by = updated_by
     
     db.commit()
-    db.refresh(db_project)
     return db_project
 
 
@@ -162,11 +170,15 @@ def delete_project(db: Session, project_id: UUID) -> bool:
 
 
 def get_project_stats(db: Session, project_id: UUID) -> dict:
-    # Get counts
-    test_cases_count = db.query(func.count(TestCase.id)).filter(TestCase.project_id == project_id).scalar()
-    fixtures_count = db.query(func.count(Fixture.id)).filter(Fixture.project_id == project_id).scalar()
+    # Get both counts in one round-trip via scalar subqueries
+    row = db.execute(
+        select(
+            select(func.count(TestCase.id)).where(TestCase.project_id == project_id).scalar_subquery().label("test_cases_count"),
+            select(func.count(Fixture.id)).where(Fixture.project_id == project_id).scalar_subquery().label("fixtures_count"),
+        )
+    ).one()
     
     return {
-        "test_cases_count": test_cases_count,
-        "fixtures_count": fixtures_count
+        "test_cases_count": row.test_cases_count,
+        "fixtures_count": row.fixtures_count
     } 
\ No newline at end of file
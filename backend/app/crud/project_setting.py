@@ -1,12 +1,56 @@
+from fastapi import BackgroundTasks
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict
 
 from ..models.project_setting import ProjectSetting
 from ..schemas.project_setting import ProjectSettingCreate, ProjectSettingUpdate
+import asyncio
 import logging
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Settings rendered into playwright.config.ts
+PLAYWRIGHT_CONFIG_KEYS = frozenset({
+    'BASE_URL', 'TIMEOUT', 'EXPECT_TIMEOUT', 'RETRIES', 'WORKERS',
+    'VIEWPORT_WIDTH', 'VIEWPORT_HEIGHT', 'FULLY_PARALLEL', 'HEADLESS_MODE',
+    'SCREENSHOT', 'VIDEO',
+})
+
+# Settings entered in seconds but stored in milliseconds
+_TIMEOUT_KEYS = frozenset({'TIMEOUT', 'EXPECT_TIMEOUT'})
+
+# {{KEY}} placeholders in the config template
+_PLACEHOLDER_RE = re.compile(r'\{\{(\w+)\}\}')
+
+# Resolved once at import; backend/ holds the templates, its parent the playwright projects
+_BASE_DIR = Path(__file__).resolve().parent.parent.parent
+PLAYWRIGHT_CONFIG_TEMPLATE_PATH = _BASE_DIR / "template" / "playwright.config.ts.template"
+_PLAYWRIGHT_PROJECTS_DIR = _BASE_DIR.parent / "playwright_projects"
+
+# One lock per project so concurrent regenerations don't clobber the config backup
+_config_locks: Dict[str, threading.Lock] = {}
+_config_locks_guard = threading.Lock()
+
+
+def _normalize_setting_value(key: str, value):
+    """Convert timeout values from seconds to milliseconds; other values pass through"""
+    if key in _TIMEOUT_KEYS:
+        try:
+            # Whole seconds skip the float round-trip (and its rounding)
+            if isinstance(value, str) and value.isdigit():
+                return str(int(value) * 1000)
+            return str(int(float(value) * 1000))
+        except (ValueError, TypeError):
+            # If conversion fails, keep original value
+            pass
+    return value
+
 
 def get_project_setting(db: Session, setting_id: str) -> Optional[ProjectSetting]:
     return db.query(ProjectSetting).filter(ProjectSetting.id == setting_id).first()
@@ -31,16 +75,7 @@ def get_setting_by_key(db: Session, project_id: str, key: str) -> Optional[Proje
 
 def create_project_setting(db: Session, setting: ProjectSettingCreate) -> ProjectSetting:
     # Convert timeout values from seconds to milliseconds before saving
-    processed_value = setting.value
-    if setting.key in ['TIMEOUT', 'EXPECT_TIMEOUT']:
-        try:
-            # Convert seconds to milliseconds
-            seconds = float(setting.value)
-            milliseconds = int(seconds * 1000)
-            processed_value = str(milliseconds)
-        except (ValueError, TypeError):
-            # If conversion fails, keep original value
-            processed_value = setting.value
+    processed_value = _normalize_setting_value(setting.key, setting.value)
     
     db_setting = ProjectSetting(
         project_id=setting.project_id,
@@ -50,88 +85,59 @@ def create_project_setting(db: Session, setting: ProjectSettingCreate) -> Projec
     )
     db.add(db_setting)
     db.commit()
-    db.refresh(db_setting)
     return db_setting
 
 
-async def update_project_setting(db: Session, setting_id: str, setting: ProjectSettingUpdate) -> Optional[ProjectSetting]:
+async def update_project_setting(db: Session, setting_id: str, setting: ProjectSettingUpdate, background_tasks: Optional[BackgroundTasks] = None) -> Optional[ProjectSetting]:
     db_setting = get_project_setting(db, setting_id)
     if db_setting:
-        update_data = setting.dict(exclude_unset=True)
+        update_data = setting.model_dump(exclude_unset=True)
         
         # Convert timeout values from seconds to milliseconds before saving
-        if 'value' in update_data and db_setting.key in ['TIMEOUT', 'EXPECT_TIMEOUT']:
-            try:
-                # Convert seconds to milliseconds
-                seconds = float(update_data['value'])
-                milliseconds = int(seconds * 1000)
-                update_data['value'] = str(milliseconds)
-            except (ValueError, TypeError):
-                # If conversion fails, keep original value
-                pass
+        if 'value' in update_data:
+            update_data['value'] = _normalize_setting_value(db_setting.key, update_data['value'])
         
         for field, value in update_data.items():
             setattr(db_setting, field, value)
         
         db.commit()
-        db.refresh(db_setting)
         
         # Regenerate playwright config if this is a Playwright setting
-        if db_setting.key in ['BASE_URL', 'TIMEOUT', 'EXPECT_TIMEOUT', 'RETRIES', 'WORKERS', 
-                             'VIEWPORT_WIDTH', 'VIEWPORT_HEIGHT', 'FULLY_PARALLEL', 'HEADLESS_MODE', 
-                             'SCREENSHOT', 'VIDEO']:
-            await _regenerate_playwright_config(db, str(db_setting.project_id))
+        if db_setting.key in PLAYWRIGHT_CONFIG_KEYS:
+            await _schedule_config_regeneration(str(db_setting.project_id), background_tasks)
     
     return db_setting
 
 
-async def upsert_setting(db: Session, project_id: str, key: str, value: str, updated_by: str = None) -> ProjectSetting:
+async def upsert_setting(db: Session, project_id: str, key: str, value: str, updated_by: str = None, background_tasks: Optional[BackgroundTasks] = None) -> ProjectSetting:
     """Create or update a setting"""
     # Convert timeout values from seconds to milliseconds before saving
-    processed_value = value
-    if key in ['TIMEOUT', 'EXPECT_TIMEOUT']:
-        try:
-            # Convert seconds to milliseconds
-            seconds = float(value)
-            milliseconds = int(seconds * 1000)
-            processed_value = str(milliseconds)
-        except (ValueError, TypeError):
-            # If conversion fails, keep original value
-            processed_value = value
+    processed_value = _normalize_setting_value(key, value)
     
-    existing = get_setting_by_key(db, project_id, key)
+    # Single INSERT ... ON CONFLICT against uix_project_key; race-free under concurrent writers
+    stmt = pg_insert(ProjectSetting).values(
+        project_id=project_id,
+        key=key,
+        value=processed_value,
+        created_by=updated_by
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProjectSetting.project_id, ProjectSetting.key],
+        set_={
+            'value': stmt.excluded.value,
+            'updated_by': updated_by,
+            'updated_at': func.now(),
+        }
+    ).returning(ProjectSetting)
+    # populate_existing refreshes an instance already loaded in this session
+    setting = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+    db.commit()
     
-    if existing:
-        existing.value = processed_value
-        existing.updated_by = updated_by
-        db.commit()
-        db.refresh(existing)
-        
-        # Regenerate playwright config if this is a Playwright setting
-        if key in ['BASE_URL', 'TIMEOUT', 'EXPECT_TIMEOUT', 'RETRIES', 'WORKERS', 
-                   'VIEWPORT_WIDTH', 'VIEWPORT_HEIGHT', 'FULLY_PARALLEL', 'HEADLESS_MODE', 
-                   'SCREENSHOT', 'VIDEO']:
-            await _regenerate_playwright_config(db, project_id)
-        
-        return existing
-    else:
-        new_setting = ProjectSetting(
-            project_id=project_id,
-            key=key,
-            value=processed_value,
-            created_by=updated_by
-        )
-        db.add(new_setting)
-        db.commit()
-        db.refresh(new_setting)
-        
-        # Regenerate playwright config if this is a Playwright setting
-        if key in ['BASE_URL', 'TIMEOUT', 'EXPECT_TIMEOUT', 'RETRIES', 'WORKERS', 
-                   'VIEWPORT_WIDTH', 'VIEWPORT_HEIGHT', 'FULLY_PARALLEL', 'HEADLESS_MODE', 
-                   'SCREENSHOT', 'VIDEO']:
-            await _regenerate_playwright_config(db, project_id)
-        
-        return new_setting
+    # Regenerate playwright config if this is a Playwright setting
+    if key in PLAYWRIGHT_CONFIG_KEYS:
+        await _schedule_config_regeneration(project_id, background_tasks)
+    
+    return setting
 
 
 def delete_project_setting(db: Session, setting_id: str) -> bool:
@@ -145,52 +151,79 @@ def delete_project_setting(db: Session, setting_id: str) -> bool:
 
 def get_settings_as_dict(db: Session, project_id: str) -> Dict[str, str]:
     """Get all project settings as key-value dictionary"""
-    settings = get_settings_by_project(db, project_id)
-    return {setting.key: setting.value for setting in settings}
+    # Only key/value are needed, so skip building ORM instances
+    rows = db.query(ProjectSetting.key, ProjectSetting.value).filter(
+        ProjectSetting.project_id == project_id
+    ).order_by(ProjectSetting.key).all()
+    return {key: value for key, value in rows}
+
 
+async def _schedule_config_regeneration(project_id: str, background_tasks: Optional[BackgroundTasks]) -> None:
+    """Regenerate the config after the response when possible, otherwise off the event loop"""
+    if background_tasks is not None:
+        background_tasks.add_task(regenerate_playwright_config, project_id)
+    else:
+        await asyncio.to_thread(regenerate_playwright_config, project_id)
+
+
+@lru_cache(maxsize=1)
+def _load_config_template() -> str:
+    """Read the static config template once; call cache_clear() if it is edited at runtime"""
+    return PLAYWRIGHT_CONFIG_TEMPLATE_PATH.read_text(encoding='utf-8')
 
-async def _regenerate_playwright_config(db: Session, project_id: str):
+
+def regenerate_playwright_config(project_id: str) -> None:
+    """Rebuild playwright.config.ts for a project using a dedicated session"""
+    with _config_locks_guard:
+        lock = _config_locks.setdefault(str(project_id), threading.Lock())
+    
+    # Runs outside the request, so it cannot share the request session
+    from ..database import get_session_local
+    with lock:
+        db = get_session_local()()
+        try:
+            _write_playwright_config(db, project_id)
+        finally:
+            db.close()
+
+
+def _write_playwright_config(db: Session, project_id: str):
     """Regenerate playwright.config.ts when project settings are updated"""
     try:
         from ..models.project import Project
-        from pathlib import Path
         
         # Get project name
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if not project:
+        project_name = db.query(Project.name).filter(Project.id == project_id).scalar()
+        if project_name is None:
             logger.error(f"Project not found for config regeneration: {project_id}")
             return
         
         # Get project settings
-        settings = get_settings_by_project(db, project_id)
-        settings_dict = {setting.key: setting.value for setting in settings}
+        settings_dict = get_settings_as_dict(db, project_id)
         
-        # Read the template file
-        template_path = Path(__file__).parent.parent.parent / "template" / "playwright.config.ts.template"
-        if not template_path.exists():
-            logger.error(f"Template file not found: {template_path}")
+        # Read the template file (cached after the first successful read)
+        try:
+            template_content = _load_config_template()
+        except FileNotFoundError:
+            logger.error(f"Template file not found: {PLAYWRIGHT_CONFIG_TEMPLATE_PATH}")
             return
         
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
-        
-        # Replace template variables with project settings
-        config_content = template_content
-        for key, value in settings_dict.items():
-            placeholder = f"{{{{{key}}}}}"
-            config_content = config_content.replace(placeholder, str(value))
+        # Replace template variables with project settings in one pass; unknown keys stay as-is
+        config_content = _PLACEHOLDER_RE.sub(
+            lambda m: str(settings_dict.get(m.group(1), m.group(0))),
+            template_content
+        )
         
         # Determine correct Playwright project directory using cleaned folder name
         try:
             from ..services.playwright_project import clean_name as clean_project_folder_name
-            cleaned_name = clean_project_folder_name(project.name)
+            cleaned_name = clean_project_folder_name(project_name)
         except Exception:
             # Fallback: basic cleaning
-            import re
-            cleaned_name = re.sub(r'\s+', '-', re.sub(r'[^\w\s-]', '', project.name.lower())).strip('-')
+            cleaned_name = re.sub(r'\s+', '-', re.sub(r'[^\w\s-]', '', project_name.lower())).strip('-')
 
         # Write the generated config to the project directory
-        project_dir = Path(__file__).parent.parent.parent.parent / "playwright_projects" / cleaned_name
+        project_dir = _PLAYWRIGHT_PROJECTS_DIR / cleaned_name
         config_file_path = project_dir / "playwright.config.ts"
         
         if config_file_path.exists():
@@ -204,7 +237,7 @@ async def _regenerate_playwright_config(db: Session, project_id: str):
         with open(config_file_path, 'w', encoding='utf-8') as f:
             f.write(config_content)
         
-        logger.info(f"Successfully regenerated playwright.config.ts for project '{project.name}'")
+        logger.info(f"Successfully regenerated playwright.config.ts for project '{project_name}'")
         
     except Exception as e:
         logger.error(f"Failed to regenerate playwright config for project {project_id}: {str(e)}") 
\ No newline at end of file
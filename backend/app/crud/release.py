@@ -1,17 +1,24 @@
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session, joinedload
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID
 
 from ..models.sprint import Release, ReleaseTestCase
 from ..models.test_case import TestCase
-from ..models.user import User
+from .user import get_usernames_by_ids
 from ..schemas.release import ReleaseCreate, ReleaseUpdate, ReleaseTestCaseCreate, ReleaseTestCaseUpdate
 
 
 # ============ RELEASE CRUD ============
 
 def get_release(db: Session, release_id: str) -> Optional[Release]:
-    return db.query(Release).filter(Release.id == release_id).first()
+    """Primary-key lookup through the identity map; repeat calls in a request cost no SELECT"""
+    try:
+        # Identity map is keyed by UUID objects, so normalize before lookup
+        pk = UUID(str(release_id))
+    except ValueError:
+        return None
+    return db.get(Release, pk)
 
 
 def get_releases(db: Session, skip: int = 0, limit: int = 100) -> List[Release]:
@@ -44,7 +51,6 @@ def create_release(db: Session, release: ReleaseCreate) -> Release:
     )
     db.add(db_release)
     db.commit()
-    db.refresh(db_release)
     return db_release
 
 
@@ -61,12 +67,12 @@ def update_release(db: Session, release_id: str, release: ReleaseUpdate) -> Opti
 
 
 def delete_release(db: Session, release_id: str) -> bool:
-    db_release = get_release(db, release_id)
-    if db_release:
-        db.delete(db_release)
-        db.commit()
-        return True
-    return False
+    # Bulk DELETEs skip loading the release; its test case links go first,
+    # standing in for the ORM delete-orphan cascade
+    db.query(ReleaseTestCase).filter(ReleaseTestCase.release_id == release_id).delete(synchronize_session="fetch")
+    deleted = db.query(Release).filter(Release.id == release_id).delete(synchronize_session="fetch")
+    db.commit()
+    return deleted > 0
 
 
 # ============ RELEASE TEST CASE CRUD ============
@@ -81,26 +87,23 @@ def get_release_test_cases(db: Session, release_id: str) -> List[ReleaseTestCase
     ).all()
 
 
-def get_release_test_cases_with_details(db: Session, release_id: str) -> List[dict]:
-    """Get release test cases with test case details"""
+def get_release_test_cases_with_details(db: Session, release_id: str, skip: int = 0, limit: int = 100) -> List[dict]:
+    """Get a page of release test cases with test case details"""
+    # Select plain columns so no ReleaseTestCase instances are built per row
     results = db.query(
-        ReleaseTestCase,
+        *ReleaseTestCase.__table__.columns,
         TestCase.name.label('test_case_name'),
         TestCase.status.label('test_case_status')
     ).join(
         TestCase, ReleaseTestCase.test_case_id == TestCase.id
     ).filter(
         ReleaseTestCase.release_id == release_id
-    ).all()
+    ).order_by(
+        # Stable order so consecutive pages neither skip nor repeat rows
+        ReleaseTestCase.created_at, ReleaseTestCase.id
+    ).offset(skip).limit(limit).all()
     
-    return [
-        {
-            **rtc.__dict__,
-            'test_case_name': test_case_name,
-            'test_case_status': test_case_status
-        }
-        for rtc, test_case_name, test_case_status in results
-    ]
+    return [row._asdict() for row in results]
 
 
 def add_test_case_to_release(db: Session, release_test_case: ReleaseTestCaseCreate) -> ReleaseTestCase:
@@ -112,7 +115,6 @@ def add_test_case_to_release(db: Session, release_test_case: ReleaseTestCaseCrea
     )
     db.add(db_release_test_case)
     db.commit()
-    db.refresh(db_release_test_case)
     return db_release_test_case
 
 
@@ -129,61 +131,49 @@ def update_release_test_case(db: Session, release_test_case_id: str, release_tes
 
 
 def remove_test_case_from_release(db: Session, release_id: str, test_case_id: str) -> bool:
-    db_release_test_case = db.query(ReleaseTestCase).filter(
+    deleted = db.query(ReleaseTestCase).filter(
         ReleaseTestCase.release_id == release_id,
         ReleaseTestCase.test_case_id == test_case_id
-    ).first()
-    
-    if db_release_test_case:
-        db.delete(db_release_test_case)
-        db.commit()
-        return True
-    return False
+    ).delete(synchronize_session="fetch")
+    db.commit()
+    return deleted > 0
 
 
 def bulk_add_test_cases_to_release(db: Session, release_id: str, test_case_ids: List[str], version: str = "1.0.0", created_by: str = None) -> List[ReleaseTestCase]:
     """Add multiple test cases to a release"""
-    results = []
-    
-    for test_case_id in test_case_ids:
-        # Check if already exists
-        existing = db.query(ReleaseTestCase).filter(
+    # Fetch the ids already in the release with one query instead of one per candidate
+    existing = {
+        str(test_case_id) for (test_case_id,) in db.query(ReleaseTestCase.test_case_id).filter(
             ReleaseTestCase.release_id == release_id,
-            ReleaseTestCase.test_case_id == test_case_id
-        ).first()
-        
-        if not existing:
-            release_test_case = ReleaseTestCase(
-                release_id=release_id,
-                test_case_id=test_case_id,
-                version=version,
-                created_by=created_by
-            )
-            db.add(release_test_case)
-            results.append(release_test_case)
+            ReleaseTestCase.test_case_id.in_(test_case_ids)
+        )
+    }
+    
+    rows = []
+    for test_case_id in dict.fromkeys(test_case_ids):
+        if str(test_case_id) not in existing:
+            rows.append({
+                "release_id": release_id,
+                "test_case_id": test_case_id,
+                "version": version,
+                "created_by": created_by
+            })
+    
+    if not rows:
+        return []
     
+    # One executemany INSERT; RETURNING hands back the populated rows without a refresh per row
+    results = db.scalars(insert(ReleaseTestCase).returning(ReleaseTestCase), rows).all()
     db.commit()
-    for result in results:
-        db.refresh(result)
     
     return results
 
 
 # ============ RELEASE ANALYTICS ============
 
-def get_release_stats(db: Session, release_id: str) -> dict:
-    """Get release statistics"""
-    # Get all test cases in release with their current status
-    test_cases_data = db.query(
-        ReleaseTestCase,
-        TestCase.status
-    ).join(
-        TestCase, ReleaseTestCase.test_case_id == TestCase.id
-    ).filter(
-        ReleaseTestCase.release_id == release_id
-    ).all()
-    
-    total_test_cases = len(test_cases_data)
+def _summarize_status_counts(status_counts: Dict[str, int]) -> dict:
+    """Build the release stats payload from per-status test case counts"""
+    total_test_cases = sum(status_counts.values())
     
     if total_test_cases == 0:
         return {
@@ -192,11 +182,6 @@ def get_release_stats(db: Session, release_id: str) -> dict:
             "release_progress": 0.0
         }
     
-    # Group by status
-    status_counts = {}
-    for _, status in test_cases_data:
-        status_counts[status] = status_counts.get(status, 0) + 1
-    
     # Calculate progress (passed tests / total tests)
     passed_tests = status_counts.get("passed", 0)
     release_progress = (passed_tests / total_test_cases) * 100
@@ -208,28 +193,54 @@ def get_release_stats(db: Session, release_id: str) -> dict:
     }
 
 
+def get_release_stats(db: Session, release_id: str) -> dict:
+    """Get release statistics"""
+    # Count test cases per status in the database; only one row per status comes back
+    rows = db.query(
+        TestCase.status,
+        func.count().label('count')
+    ).join(
+        ReleaseTestCase, ReleaseTestCase.test_case_id == TestCase.id
+    ).filter(
+        ReleaseTestCase.release_id == release_id
+    ).group_by(TestCase.status).all()
+    
+    return _summarize_status_counts({status: count for status, count in rows})
+
+
 def get_project_releases_summary(db: Session, project_id: str) -> List[dict]:
     """Get summary of all releases for a project"""
-    releases = get_releases_by_project(db, project_id)
+    # Plain column rows: the summary never touches relationships, so no ORM instances
+    # (and no lazy loads or _sa_instance_state) are built for the releases
+    releases = db.query(*Release.__table__.columns).filter(
+        Release.project_id == project_id
+    ).order_by(Release.created_at.desc()).all()
+    if not releases:
+        return []
     
-    summary = []
-    for release in releases:
-        stats = get_release_stats(db, str(release.id))
-        
-        # Populate author_name
-        author_name = None
-        if release.created_by:
-            try:
-                user = db.query(User).filter(User.id == UUID(release.created_by)).first()
-                author_name = user.username if user else None
-            except ValueError:
-                # Handle case where created_by is not a valid UUID
-                author_name = None
-        
-        summary.append({
-            **release.__dict__,
-            "stats": stats,
-            "author_name": author_name
-        })
+    # Count test cases per release and status in one aggregate query
+    counts_by_release: Dict[str, Dict[str, int]] = {}
+    rows = db.query(
+        ReleaseTestCase.release_id,
+        TestCase.status,
+        func.count().label('count')
+    ).join(
+        TestCase, ReleaseTestCase.test_case_id == TestCase.id
+    ).filter(
+        ReleaseTestCase.release_id.in_([release.id for release in releases])
+    ).group_by(
+        ReleaseTestCase.release_id, TestCase.status
+    ).all()
+    for release_id, status, count in rows:
+        counts_by_release.setdefault(str(release_id), {})[status] = count
+    
+    authors = get_usernames_by_ids(db, (release.created_by for release in releases))
     
-    return summary 
\ No newline at end of file
+    return [
+        {
+            **release._asdict(),
+            "stats": _summarize_status_counts(counts_by_release.get(str(release.id), {})),
+            "author_name": authors.get(str(release.created_by)) if release.created_by else None
+        }
+        for release in releases
+    ]
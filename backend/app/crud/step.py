@@ -1,12 +1,78 @@
+from sqlalchemy import event, func
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
+from uuid import UUID
+import logging
 
+from ..models.fixture import Fixture
 from ..models.step import Step
 from ..schemas.step import StepCreate, StepUpdate
 
+logger = logging.getLogger(__name__)
+
+# Session.info key of the fixture id -> (type, name) memo. Sessions are opened per
+# request (see database.get_db), so the memo lives exactly as long as the request.
+_FIXTURE_CACHE_KEY = "step_fixture_cache"
+
+
+def _fixture_cache(db: Session) -> Dict[str, Tuple[str, str]]:
+    return db.info.setdefault(_FIXTURE_CACHE_KEY, {})
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_fixtures(session, flush_context):
+    """Drop memoized fixtures written through the ORM in this session"""
+    cache = session.info.get(_FIXTURE_CACHE_KEY)
+    if cache:
+        for obj in list(session.dirty) + list(session.deleted):
+            if isinstance(obj, Fixture):
+                cache.pop(str(obj.id), None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_bulk_fixture_writes(orm_execute_state):
+    """Bulk UPDATE/DELETE statements bypass the flush, so forget every memoized fixture"""
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and orm_execute_state.bind_mapper is Fixture.__mapper__:
+        orm_execute_state.session.info.pop(_FIXTURE_CACHE_KEY, None)
+
+
+def _get_fixture_type_and_name(db: Session, fixture_id) -> Optional[Tuple[str, str]]:
+    """Return (type, name) of a fixture, querying it at most once per request"""
+    cache = _fixture_cache(db)
+    key = str(fixture_id)
+    if key not in cache:
+        fixture = db.query(Fixture.type, Fixture.name).filter(Fixture.id == fixture_id).first()
+        if not fixture:
+            return None
+        cache[key] = tuple(fixture)
+    return cache[key]
+
+
+def _list_steps_with_fixture_names(db: Session, *criteria) -> List[Step]:
+    """Steps matching criteria in step order, with referenced fixtures joined in the same SELECT"""
+    rows = db.query(Step, Fixture.type, Fixture.name).outerjoin(
+        Fixture, Step.referenced_fixture_id == Fixture.id
+    ).filter(*criteria).order_by(Step.order).all()
+    
+    cache = _fixture_cache(db)
+    steps = []
+    for step, fixture_type, fixture_name in rows:
+        if step.referenced_fixture_id:
+            if fixture_type is not None:
+                cache[str(step.referenced_fixture_id)] = (fixture_type, fixture_name)
+            step.referenced_fixture_name = fixture_name if fixture_type is not None else "Unknown Fixture"
+        steps.append(step)
+    return steps
+
 
 def get_step(db: Session, step_id: str) -> Optional[Step]:
-    return db.query(Step).filter(Step.id == step_id).first()
+    """Primary-key lookup through the identity map; repeat calls in a request cost no SELECT"""
+    try:
+        # Identity map is keyed by UUID objects, so normalize before lookup
+        pk = UUID(str(step_id))
+    except ValueError:
+        return None
+    return db.get(Step, pk)
 
 
 def get_steps(db: Session, skip: int = 0, limit: int = 100) -> List[Step]:
@@ -14,34 +80,12 @@ def get_steps(db: Session, skip: int = 0, limit: int = 100) -> List[Step]:
 
 
 def get_steps_by_test_case(db: Session, test_case_id: str) -> List[Step]:
-    steps = db.query(Step).filter(
-        Step.test_case_id == test_case_id
-    ).order_by(Step.order).all()
-    
-    # Add referenced fixture names
-    for step in steps:
-        if step.referenced_fixture_id:
-            from ..models.fixture import Fixture
-            fixture = db.query(Fixture.name).filter(Fixture.id == step.referenced_fixture_id).first()
-            step.referenced_fixture_name = fixture[0] if fixture else "Unknown Fixture"
-    
-    return steps
+    return _list_steps_with_fixture_names(db, Step.test_case_id == test_case_id)
 
 
 def get_steps_by_fixture(db: Session, fixture_id: str) -> List[Step]:
     """Get steps that reference/call a fixture (for backwards compatibility)"""
-    steps = db.query(Step).filter(
-        Step.referenced_fixture_id == fixture_id
-    ).order_by(Step.order).all()
-    
-    # Add referenced fixture names
-    for step in steps:
-        if step.referenced_fixture_id:
-            from ..models.fixture import Fixture
-            fixture = db.query(Fixture.name).filter(Fixture.id == step.referenced_fixture_id).first()
-            step.referenced_fixture_name = fixture[0] if fixture else "Unknown Fixture"
-    
-    return steps
+    return _list_steps_with_fixture_names(db, Step.referenced_fixture_id == fixture_id)
 
 
 def get_fixture_steps(db: Session, fixture_id: str) -> List[Step]:
@@ -54,69 +98,34 @@ def get_fixture_steps(db: Session, fixture_id: str) -> List[Step]:
     # we'll return steps that have test_case_id = null and are related to this fixture
     # This might need adjustment based on your actual data model
     
-    steps = db.query(Step).filter(
+    return _list_steps_with_fixture_names(
+        db,
         Step.test_case_id == None,  # Steps not belonging to any test case
         Step.referenced_fixture_id == fixture_id  # But somehow related to this fixture
-    ).order_by(Step.order).all()
-    
-    # Add referenced fixture names
-    for step in steps:
-        if step.referenced_fixture_id:
-            from ..models.fixture import Fixture
-            fixture = db.query(Fixture.name).filter(Fixture.id == step.referenced_fixture_id).first()
-            step.referenced_fixture_name = fixture[0] if fixture else "Unknown Fixture"
-    
-    return steps
+    )
 
 
 def create_step(db: Session, step: StepCreate) -> Step:
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    logger.info(f"=== CREATE STEP DEBUG START ===")
-    logger.info(f"Creating step with data:")
-    logger.info(f"  - test_case_id: {step.test_case_id}")
-    logger.info(f"  - referenced_fixture_id: {step.referenced_fixture_id}")
-    logger.info(f"  - action: {step.action}")
-    logger.info(f"  - order: {step.order}")
-    
-    # Validate fixture call rules
+    # Validate fixture call rules and auto-fill from the fixture, fetched once
+    action = step.action
+    referenced_fixture_type = None
     if step.referenced_fixture_id:
-        from ..models.fixture import Fixture
-        fixture = db.query(Fixture).filter(Fixture.id == step.referenced_fixture_id).first()
+        fixture = _get_fixture_type_and_name(db, step.referenced_fixture_id)
         if not fixture:
-            logger.error(f"Fixture with id {step.referenced_fixture_id} not found")
             raise ValueError(f"Fixture with id {step.referenced_fixture_id} not found")
-        
-        logger.info(f"Found fixture: {fixture.name} (type: {fixture.type})")
+        fixture_type, fixture_name = fixture
         
         # Check fixture type and order validation
-        if fixture.type == "extend" and step.order != 1:
-            logger.error(f"Extend fixtures can only be called at step 1 (order = 1)")
+        if fixture_type == "extend" and step.order != 1:
             raise ValueError("Extend fixtures can only be called at step 1 (order = 1)")
-        elif fixture.type == "inline" and step.order == 1:
-            logger.error(f"Inline fixtures cannot be called at step 1 (order = 1)")
+        elif fixture_type == "inline" and step.order == 1:
             raise ValueError("Inline fixtures cannot be called at step 1 (order = 1)")
-    
-    # Auto-set action to fixture name if referenced_fixture_id is provided and action is empty
-    action = step.action
-    referenced_fixture_type = None
-    if step.referenced_fixture_id:
-        # Always get fixture type when referenced_fixture_id is provided
-        from ..models.fixture import Fixture
-        fixture_obj = db.query(Fixture).filter(Fixture.id == step.referenced_fixture_id).first()
-        if fixture_obj:
-            referenced_fixture_type = fixture_obj.type
-            logger.info(f"Setting referenced_fixture_type to: {referenced_fixture_type}")
-            
-            # Auto-set action to fixture name if action is empty
-            if not action:
-                action = fixture_obj.name
-                logger.info(f"Auto-set action to fixture name: {action}")
-    
-    logger.info(f"Final step data:")
-    logger.info(f"  - action: {action}")
-    logger.info(f"  - referenced_fixture_type: {referenced_fixture_type}")
+        
+        referenced_fixture_type = fixture_type
+        
+        # Auto-set action to fixture name if action is empty
+        if not action:
+            action = fixture_name
     
     db_step = Step(
         test_case_id=step.test_case_id,
@@ -131,69 +140,85 @@ def create_step(db: Session, step: StepCreate) -> Step:
         created_by=step.created_by
     )
     
-    logger.info(f"About to create step in database:")
-    logger.info(f"  - test_case_id: {db_step.test_case_id}")
-    logger.info(f"  - referenced_fixture_id: {db_step.referenced_fixture_id}")
-    
     db.add(db_step)
     db.commit()
-    db.refresh(db_step)
     
-    logger.info(f"Successfully created step with ID: {db_step.id}")
-    logger.info(f"=== CREATE STEP DEBUG END ===")
+    logger.debug(
+        "Created step %s (test_case_id=%s, referenced_fixture_id=%s, order=%s)",
+        db_step.id, db_step.test_case_id, db_step.referenced_fixture_id, db_step.order
+    )
     
     return db_step
 
 
+def _get_step_and_fixture(db: Session, step_id: str, fixture_id) -> Tuple[Optional[Step], Optional[Tuple[str, str]]]:
+    """Load a step and the (type, name) of a fixture it is about to reference in one SELECT"""
+    cache = _fixture_cache(db)
+    if str(fixture_id) in cache:
+        return get_step(db, step_id), cache[str(fixture_id)]
+    try:
+        step_pk = UUID(str(step_id))
+    except ValueError:
+        return None, None
+    row = db.query(Step, Fixture.type, Fixture.name).outerjoin(
+        Fixture, Fixture.id == fixture_id
+    ).filter(Step.id == step_pk).first()
+    if not row:
+        return None, None
+    db_step, fixture_type, fixture_name = row
+    if fixture_type is None:
+        return db_step, None
+    cache[str(fixture_id)] = (fixture_type, fixture_name)
+    return db_step, cache[str(fixture_id)]
+
+
 def update_step(db: Session, step_id: str, step: StepUpdate) -> Optional[Step]:
-    db_step = get_step(db, step_id)
+    if step.referenced_fixture_id is None:
+        db_step = get_step(db, step_id)
+    else:
+        # Validating a new fixture reference: fetch the step and fixture together
+        db_step, fixture = _get_step_and_fixture(db, step_id, step.referenced_fixture_id)
     if db_step:
         # Validate fixture call rules if referenced_fixture_id is being updated
         if step.referenced_fixture_id is not None:
-            from ..models.fixture import Fixture
-            fixture = db.query(Fixture).filter(Fixture.id == step.referenced_fixture_id).first()
             if not fixture:
                 raise ValueError(f"Fixture with id {step.referenced_fixture_id} not found")
+            fixture_type = fixture[0]
             
             # Check fixture type and order validation
             order = step.order if step.order is not None else db_step.order
-            if fixture.type == "extend" and order != 1:
+            if fixture_type == "extend" and order != 1:
                 raise ValueError("Extend fixtures can only be called at step 1 (order = 1)")
-            elif fixture.type == "inline" and order == 1:
+            elif fixture_type == "inline" and order == 1:
                 raise ValueError("Inline fixtures cannot be called at step 1 (order = 1)")
             
             # Auto-set referenced_fixture_type
-            step.referenced_fixture_type = fixture.type
+            step.referenced_fixture_type = fixture_type
         
-        update_data = step.dict(exclude_unset=True)
+        update_data = step.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_step, field, value)
         
+        # eager_defaults brings updated_at back with the UPDATE, so no refresh is needed
         db.commit()
-        db.refresh(db_step)
     return db_step
 
 
 def delete_step(db: Session, step_id: str) -> bool:
-    db_step = get_step(db, step_id)
-    if db_step:
-        db.delete(db_step)
-        db.commit()
-        return True
-    return False
+    deleted = db.query(Step).filter(Step.id == step_id).delete(synchronize_session="fetch")
+    db.commit()
+    return deleted > 0
 
 
 def get_max_order_for_test_case(db: Session, test_case_id: str) -> int:
     """Get the maximum order value for steps in a test case"""
-    result = db.query(Step.order).filter(
+    return db.query(func.max(Step.order)).filter(
         Step.test_case_id == test_case_id
-    ).order_by(Step.order.desc()).first()
-    return result[0] if result else 0
+    ).scalar() or 0
 
 
 def get_max_order_for_fixture(db: Session, fixture_id: str) -> int:
     """Get the maximum order value for steps in a fixture"""
-    result = db.query(Step.order).filter(
+    return db.query(func.max(Step.order)).filter(
         Step.referenced_fixture_id == fixture_id
-    ).order_by(Step.order.desc()).first()
-    return result[0] if result else 0 
\ No newline at end of file
+    ).scalar() or 0
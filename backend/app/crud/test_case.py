@@ -1,8 +1,13 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import List, Optional
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, bindparam, exists, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import List, Optional, Tuple
 from uuid import UUID
+import asyncio
 import logging
+import os
+import stat
+from functools import lru_cache
 from pathlib import Path
 
 from ..models.test_case import TestCase
@@ -13,6 +18,43 @@ from ..models.test_case import test_case_fixtures
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import (we're in backend/app/crud)
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_PLAYWRIGHT_PROJECTS_DIR = _PROJECT_ROOT / "playwright_projects"
+
+_REORDER_FIXTURE_STMT = test_case_fixtures.update().where(
+    and_(
+        test_case_fixtures.c.test_case_id == bindparam("tc_id"),
+        test_case_fixtures.c.fixture_id == bindparam("fx_id")
+    )
+).values(order=bindparam("new_order"))
+
+
+# (directory mtime, project subdirectories); swapped as one tuple so readers never see a half update
+_project_dirs_snapshot: Tuple[Optional[int], Tuple[Path, ...]] = (None, ())
+
+
+def _playwright_project_dirs() -> Tuple[Path, ...]:
+    """List the playwright project directories, rescanning only when playwright_projects changes"""
+    global _project_dirs_snapshot
+    try:
+        mtime_ns = _PLAYWRIGHT_PROJECTS_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    cached_mtime_ns, project_dirs = _project_dirs_snapshot
+    if cached_mtime_ns != mtime_ns:
+        # Adding or removing a project bumps the directory mtime and lands here
+        with os.scandir(_PLAYWRIGHT_PROJECTS_DIR) as entries:
+            project_dirs = tuple(Path(entry.path) for entry in entries if entry.is_dir())
+        _project_dirs_snapshot = (mtime_ns, project_dirs)
+    return project_dirs
+
+
+@lru_cache(maxsize=256)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a file once per (path, mtime, size); rewriting the file changes the key"""
+    return Path(path).read_text(encoding='utf-8')
+
 
 def _read_test_case_file_content(test_file_path: str) -> Optional[str]:
     """
@@ -32,27 +74,24 @@ def _read_test_case_file_content(test_file_path: str) -> Optional[str]:
         
         # If it's a relative path, make it absolute by joining with project root
         if not file_path.is_absolute():
-            # Get project root (assuming we're in backend/app/crud)
-            current_file = Path(__file__)
-            project_root = current_file.parent.parent.parent.parent  # Go up to project root
-            playwright_projects_dir = project_root / "playwright_projects"
-            
             # Try to find the file in playwright_projects directory
             # test_file_path might be like "tests/loginTest.spec.ts"
-            for project_dir in playwright_projects_dir.glob("*"):
-                if project_dir.is_dir():
-                    potential_file = project_dir / test_file_path
-                    if potential_file.exists():
-                        file_path = potential_file
-                        break
+            for project_dir in _playwright_project_dirs():
+                potential_file = project_dir / test_file_path
+                if potential_file.exists():
+                    file_path = potential_file
+                    break
             else:
                 # If not found in any project, try as relative to project root
-                file_path = project_root / test_file_path
+                file_path = _PROJECT_ROOT / test_file_path
         
-        # Read file content
-        if file_path.exists() and file_path.is_file():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        # Read file content; unchanged files are served from memory
+        try:
+            file_stat = file_path.stat()
+        except FileNotFoundError:
+            file_stat = None
+        if file_stat is not None and stat.S_ISREG(file_stat.st_mode):
+            content = _read_text_cached(str(file_path), file_stat.st_mtime_ns, file_stat.st_size)
             logger.info(f"Successfully read test case file content: {file_path}")
             return content
         else:
@@ -78,15 +117,14 @@ async def regenerate_test_case_script(db: Session, test_case_id: str, project_na
     """
     try:
         # Get test case from database
-        test_case = get_test_case(db, test_case_id)
+        test_case = get_test_case(db, test_case_id, with_project=not project_name)
         if not test_case:
             logger.error(f"Test case not found: {test_case_id}")
             return False
         
         # Get project name if not provided
         if not project_name:
-            from ..models.project import Project
-            project = db.query(Project).filter(Project.id == test_case.project_id).first()
+            project = test_case.project
             if project:
                 project_name = project.name
             else:
@@ -96,22 +134,25 @@ async def regenerate_test_case_script(db: Session, test_case_id: str, project_na
         # Import here to avoid circular imports
         from ..services.playwright_test_case import generate_test_script, save_test_script
         
-        # Generate test script
-        result = generate_test_script(db, test_case_id, project_name)
+        # Generate test script off the event loop; the session is only handed to the
+        # worker thread while this coroutine awaits it, so it is never used concurrently
+        result = await asyncio.to_thread(generate_test_script, db, test_case_id, project_name)
         
         if not result.get('success'):
             logger.error(f"Failed to generate test script for test case {test_case_id}: {result.get('error')}")
             return False
         
         # Save test script to project
-        save_result = save_test_script(project_name, result)
+        save_result = await asyncio.to_thread(save_test_script, project_name, result)
         
         if not save_result.get('success'):
             logger.error(f"Failed to save test script for test case {test_case_id}: {save_result.get('error')}")
             return False
         
-        # Read the generated file content and save to playwright_script
-        file_content = _read_test_case_file_content(save_result.get('file_path'))
+        # Store the generated content directly; the file only needs reading if none came back
+        file_content = result.get('content')
+        if file_content is None:
+            file_content = await asyncio.to_thread(_read_test_case_file_content, save_result.get('file_path'))
         if file_content and test_case:
             test_case.playwright_script = file_content
             logger.info(f"Successfully read and saved test case file content to database")
@@ -141,21 +182,21 @@ async def create_test_case(db: Session, test_case: TestCaseCreate, created_by: s
     db_test_case = TestCase(**test_case_data)
     db.add(db_test_case)
     db.commit()
-    db.refresh(db_test_case)
     
     # Generate test case file and read content
     try:
         # Get project name
-        from ..models.project import Project
-        project = db.query(Project).filter(Project.id == db_test_case.project_id).first()
+        # Many-to-one load: answered from the identity map when the project is already loaded
+        project = db_test_case.project
         if project:
             project_name = project.name
             
             # Import here to avoid circular imports
             from ..services.playwright_test_case import test_case_generator
             
-            # Generate test case file
-            test_result = test_case_generator.generate_test_case(
+            # Generate test case file (off the event loop)
+            test_result = await asyncio.to_thread(
+                test_case_generator.generate_test_case,
                 db=db,
                 test_case_id=str(db_test_case.id),
                 project_name=project_name
@@ -163,15 +204,18 @@ async def create_test_case(db: Session, test_case: TestCaseCreate, created_by: s
             
             if test_result.get('success'):
                 # Save test case file to project
-                save_result = test_case_generator.save_test_case_to_project(
+                save_result = await asyncio.to_thread(
+                    test_case_generator.save_test_case_to_project,
                     project_name=project_name,
                     test_result=test_result,
                     test_case_db=db_test_case
                 )
                 
                 if save_result.get('success'):
-                    # Read the generated file content and save to playwright_script
-                    file_content = _read_test_case_file_content(save_result.get('file_path'))
+                    # Store the generated content directly; the file only needs reading if none came back
+                    file_content = test_result.get('content')
+                    if file_content is None:
+                        file_content = await asyncio.to_thread(_read_test_case_file_content, save_result.get('file_path'))
                     if file_content:
                         db_test_case.playwright_script = file_content
                         logger.info(f"Successfully read and saved test case file content to database")
@@ -179,7 +223,6 @@ async def create_test_case(db: Session, test_case: TestCaseCreate, created_by: s
                         logger.warning(f"Could not read test case file content from: {save_result.get('file_path')}")
                     
                     db.commit()
-                    db.refresh(db_test_case)
                     
                     logger.info(f"Successfully created test case file: {save_result.get('file_path')}")
                 else:
@@ -196,8 +239,16 @@ async def create_test_case(db: Session, test_case: TestCaseCreate, created_by: s
     return db_test_case
 
 
-def get_test_case(db: Session, test_case_id: str) -> Optional[TestCase]:
-    return db.query(TestCase).filter(TestCase.id == test_case_id).first()
+def get_test_case(db: Session, test_case_id: str, with_project: bool = False) -> Optional[TestCase]:
+    """Primary-key lookup through the identity map; repeat calls in a request cost no SELECT"""
+    try:
+        # Identity map is keyed by UUID objects, so normalize before lookup
+        pk = UUID(str(test_case_id))
+    except ValueError:
+        return None
+    # Load the owning project in the same SELECT when requested
+    options = [joinedload(TestCase.project)] if with_project else None
+    return db.get(TestCase, pk, options=options)
 
 
 def get_test_cases(db: Session, skip: int = 0, limit: int = 100) -> List[TestCase]:
@@ -213,9 +264,9 @@ def get_test_cases_by_status(db: Session, status: str, skip: int = 0, limit: int
 
 
 async def update_test_case(db: Session, test_case_id: str, test_case: TestCaseUpdate, updated_by: str = None) -> Optional[TestCase]:
-    db_test_case = get_test_case(db, test_case_id)
+    db_test_case = get_test_case(db, test_case_id, with_project=True)
     if db_test_case:
-        update_data = test_case.dict(exclude_unset=True)
+        update_data = test_case.model_dump(exclude_unset=True)
         
         # Add updated_by if provided
         if updated_by:
@@ -231,16 +282,16 @@ async def update_test_case(db: Session, test_case_id: str, test_case: TestCaseUp
         if should_regenerate:
             try:
                 # Get project name
-                from ..models.project import Project
-                project = db.query(Project).filter(Project.id == db_test_case.project_id).first()
+                project = db_test_case.project
                 if project:
                     project_name = project.name
                     
                     # Import here to avoid circular imports
                     from ..services.playwright_test_case import test_case_generator
                     
-                    # Generate test case file
-                    test_result = test_case_generator.generate_test_case(
+                    # Generate test case file (off the event loop)
+                    test_result = await asyncio.to_thread(
+                        test_case_generator.generate_test_case,
                         db=db,
                         test_case_id=str(db_test_case.id),
                         project_name=project_name
@@ -248,15 +299,18 @@ async def update_test_case(db: Session, test_case_id: str, test_case: TestCaseUp
                     
                     if test_result.get('success'):
                         # Save test case file to project
-                        save_result = test_case_generator.save_test_case_to_project(
+                        save_result = await asyncio.to_thread(
+                            test_case_generator.save_test_case_to_project,
                             project_name=project_name,
                             test_result=test_result,
                             test_case_db=db_test_case
                         )
                         
                         if save_result.get('success'):
-                            # Read the updated file content and save to playwright_script
-                            file_content = _read_test_case_file_content(save_result.get('file_path'))
+                            # Store the generated content directly; the file only needs reading if none came back
+                            file_content = test_result.get('content')
+                            if file_content is None:
+                                file_content = await asyncio.to_thread(_read_test_case_file_content, save_result.get('file_path'))
                             if file_content:
                                 db_test_case.playwright_script = file_content
                                 logger.info(f"Successfully read and updated test case file content in database")
@@ -275,8 +329,9 @@ async def update_test_case(db: Session, test_case_id: str, test_case: TestCaseUp
                 logger.error(f"Error updating test case file: {str(e)}")
                 # Don't fail the database update if file generation fails
         
+        # Field edits, the new playwright_script and test_file_path all go out in this one flush;
+        # eager_defaults returns updated_at with the UPDATE, so no refresh follows
         db.commit()
-        db.refresh(db_test_case)
     return db_test_case
 
 
@@ -305,43 +360,37 @@ def delete_test_case(db: Session, test_case_id: str) -> bool:
 # Test Case Fixture CRUD operations
 def add_fixture_to_test_case(db: Session, test_case_id: str, fixture_data: TestCaseFixtureCreate, created_by: str = None) -> dict:
     """Add a fixture to a test case"""
-    # Check if test case exists
-    test_case = get_test_case(db, test_case_id)
-    if not test_case:
-        raise ValueError("Test case not found")
+    test_case_exists = exists().where(TestCase.id == test_case_id)
+    fixture_exists = exists().where(Fixture.id == fixture_data.fixture_id)
+    next_order = func.coalesce(
+        select(func.max(test_case_fixtures.c.order)).where(
+            test_case_fixtures.c.test_case_id == test_case_id
+        ).scalar_subquery(),
+        0
+    ) + 1
     
-    # Check if fixture exists
-    fixture = db.query(Fixture).filter(Fixture.id == fixture_data.fixture_id).first()
-    if not fixture:
-        raise ValueError("Fixture not found")
+    # INSERT ... SELECT validates both ends, numbers the fixture after the current last one
+    # and skips duplicates (primary key conflict) in a single round-trip
+    stmt = pg_insert(test_case_fixtures).from_select(
+        ['test_case_id', 'fixture_id', 'order', 'created_by'],
+        select(
+            literal(test_case_id, test_case_fixtures.c.test_case_id.type),
+            literal(fixture_data.fixture_id, test_case_fixtures.c.fixture_id.type),
+            next_order,
+            literal(created_by, test_case_fixtures.c.created_by.type)
+        ).where(test_case_exists, fixture_exists)
+    ).on_conflict_do_nothing().returning(test_case_fixtures.c.order)
+    order = db.execute(stmt).scalar()
     
-    # Check if fixture is already associated with test case
-    existing = db.query(test_case_fixtures).filter(
-        and_(
-            test_case_fixtures.c.test_case_id == test_case_id,
-            test_case_fixtures.c.fixture_id == fixture_data.fixture_id
-        )
-    ).first()
-    
-    if existing:
+    if order is None:
+        # Nothing inserted: find out which check failed for the error message
+        has_test_case, has_fixture = db.execute(select(test_case_exists, fixture_exists)).one()
+        if not has_test_case:
+            raise ValueError("Test case not found")
+        if not has_fixture:
+            raise ValueError("Fixture not found")
         raise ValueError("Fixture is already associated with this test case")
     
-    # Get max order for this test case
-    max_order = db.query(test_case_fixtures.c.order).filter(
-        test_case_fixtures.c.test_case_id == test_case_id
-    ).order_by(test_case_fixtures.c.order.desc()).first()
-    
-    order = (max_order[0] if max_order else 0) + 1
-    
-    # Insert the association
-    db.execute(
-        test_case_fixtures.insert().values(
-            test_case_id=test_case_id,
-            fixture_id=fixture_data.fixture_id,
-            order=order,
-            created_by=created_by
-        )
-    )
     db.commit()
     
     return {
@@ -351,6 +400,43 @@ def add_fixture_to_test_case(db: Session, test_case_id: str, fixture_data: TestC
     }
 
 
+def add_fixtures_to_test_case(db: Session, test_case_id: str, fixtures_data: List[TestCaseFixtureCreate], created_by: str = None) -> List[dict]:
+    """Add several fixtures to a test case, appended in the given order; already linked ones are skipped"""
+    if not get_test_case(db, test_case_id):
+        raise ValueError("Test case not found")
+    
+    fixture_ids = list(dict.fromkeys(fixture_data.fixture_id for fixture_data in fixtures_data))
+    if not fixture_ids:
+        return []
+    
+    found = {fixture_id for (fixture_id,) in db.query(Fixture.id).filter(Fixture.id.in_(fixture_ids))}
+    if len(found) != len(fixture_ids):
+        raise ValueError("Fixture not found")
+    
+    # Current links and the last order in one query
+    linked = db.query(test_case_fixtures.c.fixture_id, test_case_fixtures.c.order).filter(
+        test_case_fixtures.c.test_case_id == test_case_id
+    ).all()
+    linked_ids = {fixture_id for fixture_id, _ in linked}
+    last_order = max((order or 0 for _, order in linked), default=0)
+    
+    rows = [
+        {"test_case_id": test_case_id, "fixture_id": fixture_id, "order": last_order + position, "created_by": created_by}
+        for position, fixture_id in enumerate(
+            (fixture_id for fixture_id in fixture_ids if fixture_id not in linked_ids), start=1
+        )
+    ]
+    if rows:
+        # One executemany INSERT; a link added concurrently is skipped rather than failing the batch
+        db.execute(pg_insert(test_case_fixtures).on_conflict_do_nothing(), rows)
+        db.commit()
+    
+    return [
+        {"test_case_id": test_case_id, "fixture_id": str(row["fixture_id"]), "order": row["order"]}
+        for row in rows
+    ]
+
+
 def remove_fixture_from_test_case(db: Session, test_case_id: str, fixture_id: str) -> bool:
     """Remove a fixture from a test case"""
     result = db.execute(
@@ -411,14 +497,14 @@ def update_test_case_fixture_order(db: Session, test_case_id: str, fixture_id: s
 
 def reorder_test_case_fixtures(db: Session, test_case_id: str, fixture_orders: List[dict]) -> bool:
     """Reorder all fixtures for a test case"""
-    for fixture_order in fixture_orders:
+    if fixture_orders:
+        # One executemany UPDATE instead of a round-trip per fixture
         db.execute(
-            test_case_fixtures.update().where(
-                and_(
-                    test_case_fixtures.c.test_case_id == test_case_id,
-                    test_case_fixtures.c.fixture_id == fixture_order["fixture_id"]
-                )
-            ).values(order=fixture_order["order"])
+            _REORDER_FIXTURE_STMT,
+            [
+                {"tc_id": test_case_id, "fx_id": fixture_order["fixture_id"], "new_order": fixture_order["order"]}
+                for fixture_order in fixture_orders
+            ]
         )
     db.commit()
-    return True 
\ No newline at end of file
+    return True
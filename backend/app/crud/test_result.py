@@ -1,10 +1,11 @@
+from sqlalchemy import select, insert
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Iterator
 from datetime import datetime
 from uuid import UUID
 
 from ..models.test_result import TestResultHistory, TestCaseExecution
-from ..models.user import User
+from .user import get_usernames_by_ids
 from ..schemas.test_result import (
     TestResultHistoryCreate, 
     TestResultHistoryUpdate,
@@ -12,6 +13,14 @@ from ..schemas.test_result import (
     TestCaseExecutionUpdate
 )
 
+# Rows fetched per round-trip when streaming large result sets
+STREAM_BATCH_SIZE = 200
+
+# Built once at import so bulk paths only vary the parameter lists
+# RETURNING rows follow the parameter order, so callers can pair ids with their input
+_INSERT_TEST_RESULT = insert(TestResultHistory).returning(TestResultHistory.id, sort_by_parameter_order=True)
+_INSERT_EXECUTION = insert(TestCaseExecution)
+
 
 # ============ TEST RESULT HISTORY CRUD ============
 
@@ -23,23 +32,48 @@ def get_test_results(db: Session, skip: int = 0, limit: int = 100) -> List[TestR
     return db.query(TestResultHistory).offset(skip).limit(limit).all()
 
 
+def iter_test_results(db: Session, skip: int = 0, limit: int = 100) -> Iterator[TestResultHistory]:
+    """Stream test results in batches instead of materializing the whole list"""
+    stmt = (
+        select(TestResultHistory)
+        .offset(skip)
+        .limit(limit)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+    return db.scalars(stmt)
+
+
 def get_test_results_by_project(db: Session, project_id: str, skip: int = 0, limit: int = 50) -> List[TestResultHistory]:
     results = db.query(TestResultHistory).filter(
         TestResultHistory.project_id == project_id
     ).order_by(TestResultHistory.created_at.desc()).offset(skip).limit(limit).all()
     
-    # Populate author_name for each result
+    # Populate author_name for all results with one batched lookup
+    usernames = get_usernames_by_ids(db, (result.created_by for result in results))
     for result in results:
-        if result.created_by:
-            try:
-                user = db.query(User).filter(User.id == UUID(result.created_by)).first()
-                result.author_name = user.username if user else None
-            except ValueError:
-                result.author_name = None
+        result.author_name = usernames.get(result.created_by)
     
     return results
 
 
+def iter_test_results_by_project(db: Session, project_id: str, skip: int = 0, limit: int = 50) -> Iterator[TestResultHistory]:
+    """Stream a project's test results in batches, newest first, with author_name populated"""
+    stmt = (
+        select(TestResultHistory)
+        .where(TestResultHistory.project_id == project_id)
+        .order_by(TestResultHistory.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+    # One username lookup per fetched batch rather than per result
+    for batch in db.scalars(stmt).partitions():
+        usernames = get_usernames_by_ids(db, (result.created_by for result in batch))
+        for result in batch:
+            result.author_name = usernames.get(result.created_by)
+            yield result
+
+
 def get_latest_test_result(db: Session, project_id: str) -> Optional[TestResultHistory]:
     return db.query(TestResultHistory).filter(
         TestResultHistory.project_id == project_id
@@ -68,6 +102,16 @@ def create_test_result(db: Session, test_result: TestResultHistoryCreate) -> Tes
     return db_result
 
 
+def bulk_create_test_results(db: Session, test_results: List[TestResultHistoryCreate]) -> List[UUID]:
+    """Insert many test results in one executemany round-trip and return their ids"""
+    if not test_results:
+        return []
+    rows = [test_result.model_dump() for test_result in test_results]
+    result_ids = db.scalars(_INSERT_TEST_RESULT, rows).all()
+    db.commit()
+    return list(result_ids)
+
+
 def update_test_result(db: Session, result_id: str, test_result: TestResultHistoryUpdate) -> Optional[TestResultHistory]:
     db_result = get_test_result(db, result_id)
     if db_result:
@@ -101,6 +145,17 @@ def get_executions_by_result(db: Session, result_id: str) -> List[TestCaseExecut
     ).order_by(TestCaseExecution.start_time).all()
 
 
+def iter_executions_by_result(db: Session, result_id: str) -> Iterator[TestCaseExecution]:
+    """Stream executions of a test result in batches using a server-side cursor"""
+    stmt = (
+        select(TestCaseExecution)
+        .where(TestCaseExecution.test_result_id == result_id)
+        .order_by(TestCaseExecution.start_time)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+    return db.scalars(stmt)
+
+
 def get_executions_by_test_case(db: Session, test_case_id: str, limit: int = 20) -> List[TestCaseExecution]:
     return db.query(TestCaseExecution).filter(
         TestCaseExecution.test_case_id == test_case_id
@@ -139,6 +194,16 @@ def create_test_case_execution(db: Session, execution: TestCaseExecutionCreate)
     return db_execution
 
 
+def bulk_create_test_case_executions(db: Session, executions: List[TestCaseExecutionCreate]) -> int:
+    """Insert many test case executions in one executemany round-trip"""
+    if not executions:
+        return 0
+    rows = [execution.model_dump() for execution in executions]
+    db.execute(_INSERT_EXECUTION, rows)
+    db.commit()
+    return len(rows)
+
+
 def update_test_case_execution(db: Session, execution_id: str, execution: TestCaseExecutionUpdate) -> Optional[TestCaseExecution]:
     db_execution = get_test_case_execution(db, execution_id)
     if db_execution:
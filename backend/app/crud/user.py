@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
+from uuid import UUID
 from pwdlib import PasswordHash
 
 from ..models.user import User
@@ -22,6 +23,22 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
 def get_user_by_username(db: Session, username: str) -> Optional[User]:
     return db.query(User).filter(User.username == username).first()
 
+def get_usernames_by_ids(db: Session, user_ids: Iterable[Optional[str]]) -> Dict[str, str]:
+    """Resolve many user ids to usernames with a single IN query"""
+    ids = set()
+    for user_id in user_ids:
+        if not user_id:
+            continue
+        try:
+            ids.add(UUID(str(user_id)))
+        except ValueError:
+            # created_by may hold non-UUID values (e.g. emails)
+            continue
+    if not ids:
+        return {}
+    rows = db.query(User.id, User.username).filter(User.id.in_(ids)).all()
+    return {str(user_id): username for user_id, username in rows}
+
 def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
     return db.query(User).offset(skip).limit(limit).all()
 
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
@@ -13,10 +13,27 @@ _async_engine = None
 _SessionLocal = None
 _AsyncSessionLocal = None
 
+def _executemany_options():
+    # Batch executemany tuning is psycopg2-specific; other drivers reject these arguments
+    if settings.db_driver not in ("postgresql", "postgresql+psycopg2"):
+        return {}
+    return {
+        "executemany_mode": settings.db_executemany_mode,
+        "executemany_batch_page_size": settings.db_executemany_batch_page_size,
+    }
+
 def get_engine():
     global _engine
     if _engine is None:
-        _engine = create_engine(settings.database_url)
+        _engine = create_engine(
+            settings.database_url,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
+            **_executemany_options(),
+        )
     return _engine
 
 def get_async_engine():
@@ -31,7 +48,11 @@ def get_async_engine():
 def get_session_local():
     global _SessionLocal
     if _SessionLocal is None:
-        _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+        # Keep loaded state across commit (like the async factory) so committed
+        # objects can be returned without reloading every attribute. Server-side
+        # defaults come back through eager_defaults; rows changed outside this
+        # session's unit of work need a fresh query or populate_existing to be seen
+        _SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=get_engine())
     return _SessionLocal
 
 def get_async_session_local():
@@ -42,6 +63,25 @@ def get_async_session_local():
         )
     return _AsyncSessionLocal
 
+def create_missing_indexes(engine):
+    # create_all skips tables that already exist, so indexes added to models later
+    # never reach existing databases; create any that are missing (CREATE INDEX IF NOT EXISTS)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+def backfill_project_members(engine):
+    # Projects created before project_members existed have no membership rows;
+    # record each project's creator as a member. Idempotent via the unique constraint
+    with engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO project_members (id, project_id, user_id, created_by, created_at)
+            SELECT gen_random_uuid(), p.id, u.id, p.created_by, now()
+            FROM projects p
+            JOIN users u ON u.id::text = p.created_by
+            ON CONFLICT (user_id, project_id) DO NOTHING
+        """))
+
 # Dependency to get database session
 def get_db():
     db = get_session_local()()
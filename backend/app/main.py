@@ -11,7 +11,7 @@ import logging
 import os
 
 from .config import settings
-from .database import get_db, get_engine, Base
+from .database import get_db, get_engine, create_missing_indexes, backfill_project_members, Base
 from .models import *
 from .api.api import api_router
 
@@ -41,6 +41,16 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to create database tables: {e}")
         # Do not crash app if DB is unavailable at startup
+    try:
+        create_missing_indexes(get_engine())
+        logger.info("Database indexes verified successfully")
+    except Exception as e:
+        logger.error(f"Failed to create database indexes: {e}")
+    try:
+        backfill_project_members(get_engine())
+        logger.info("Project members backfilled successfully")
+    except Exception as e:
+        logger.error(f"Failed to backfill project members: {e}")
     yield
     # No teardown actions needed currently
 
@@ -2,6 +2,7 @@ from .base import BaseModel
 from .user import User
 from .project import Project
 from .project_setting import ProjectSetting
+from .project_member import ProjectMember
 from .test_case import TestCase
 from .step import Step
 from .fixture import Fixture
@@ -19,6 +20,7 @@ __all__ = [
     "User",
     "Project",
     "ProjectSetting", 
+    "ProjectMember",
     "TestCase",
     "Step",
     "Fixture",
@@ -10,4 +10,8 @@ class BaseModel(Base):
     
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now()) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Fetch server-generated created_at/updated_at via RETURNING during the flush,
+    # so callers don't need a refresh() round-trip after commit
+    __mapper_args__ = {"eager_defaults": True} 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, String, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from .base import BaseModel
@@ -16,4 +16,7 @@ class Page(BaseModel):
     project = relationship("Project", back_populates="pages")
     locators = relationship("PageLocator", back_populates="page", cascade="all, delete-orphan")
 
-
+    __table_args__ = (
+        # Serves project page listings ordered by created_at
+        Index('ix_pages_project_id_created_at', 'project_id', 'created_at'),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, String, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from .base import BaseModel
@@ -16,4 +16,7 @@ class PageLocator(BaseModel):
     # Relationships
     page = relationship("Page", back_populates="locators")
 
-
+    __table_args__ = (
+        # Serves per-page locator listings ordered by created_at
+        Index('ix_page_locators_page_id_created_at', 'page_id', 'created_at'),
+    )
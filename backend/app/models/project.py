@@ -17,12 +17,15 @@ class Project(BaseModel):
     last_run = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
-    test_cases = relationship("TestCase", back_populates="project", cascade="all, delete-orphan")
-    fixtures = relationship("Fixture", back_populates="project", cascade="all, delete-orphan")
-    test_results = relationship("TestResultHistory", back_populates="project", cascade="all, delete-orphan")
+    # Collections are only used for cascading deletes; nothing reads them, so an
+    # accidental lazy load raises instead of silently issuing a query per project
+    test_cases = relationship("TestCase", back_populates="project", cascade="all, delete-orphan", lazy="raise")
+    fixtures = relationship("Fixture", back_populates="project", cascade="all, delete-orphan", lazy="raise")
+    test_results = relationship("TestResultHistory", back_populates="project", cascade="all, delete-orphan", lazy="raise")
 
-    settings = relationship("ProjectSetting", back_populates="project", cascade="all, delete-orphan")
-    tags = relationship("Tag", back_populates="project", cascade="all, delete-orphan")
-    sprints = relationship("Sprint", back_populates="project", cascade="all, delete-orphan")
-    releases = relationship("Release", back_populates="project", cascade="all, delete-orphan") 
-    pages = relationship("Page", back_populates="project", cascade="all, delete-orphan")
\ No newline at end of file
+    settings = relationship("ProjectSetting", back_populates="project", cascade="all, delete-orphan", lazy="raise")
+    tags = relationship("Tag", back_populates="project", cascade="all, delete-orphan", lazy="raise")
+    sprints = relationship("Sprint", back_populates="project", cascade="all, delete-orphan", lazy="raise")
+    releases = relationship("Release", back_populates="project", cascade="all, delete-orphan", lazy="raise")
+    pages = relationship("Page", back_populates="project", cascade="all, delete-orphan", lazy="raise")
+    members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan", lazy="raise")
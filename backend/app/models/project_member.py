@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from .base import BaseModel
+
+
+class ProjectMember(BaseModel):
+    __tablename__ = "project_members"
+    
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    created_by = Column(String, nullable=True)
+    
+    # Relationships
+    project = relationship("Project", back_populates="members")
+    
+    __table_args__ = (
+        # Leading user_id lets "projects for this user" run as an index range scan
+        UniqueConstraint('user_id', 'project_id', name='uix_project_member_user_project'),
+    )
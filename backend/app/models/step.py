@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from .base import BaseModel
@@ -21,4 +21,12 @@ class Step(BaseModel):
     
     # Relationships
     test_case = relationship("TestCase", back_populates="steps")
-    referenced_fixture = relationship("Fixture", foreign_keys=[referenced_fixture_id]) 
\ No newline at end of file
+    referenced_fixture = relationship("Fixture", foreign_keys=[referenced_fixture_id])
+    
+    __table_args__ = (
+        # Fixture lookups select test_case_id by referenced fixture, so the index covers both
+        Index('ix_steps_referenced_fixture_id_test_case_id', 'referenced_fixture_id', 'test_case_id'),
+        # Serve per-test-case and per-fixture step listings ordered by step order
+        Index('ix_steps_test_case_id_order', 'test_case_id', 'order'),
+        Index('ix_steps_referenced_fixture_id_order', 'referenced_fixture_id', 'order'),
+    )
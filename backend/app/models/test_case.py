@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Table
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Table, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from .base import BaseModel
@@ -12,7 +12,9 @@ test_case_fixtures = Table(
     Column('fixture_id', UUID(as_uuid=True), ForeignKey('fixtures.id'), primary_key=True),
     Column('order', Integer, default=0),  # Order of fixture execution
     Column('created_at', DateTime(timezone=True), server_default='now()'),
-    Column('created_by', String, nullable=True)
+    Column('created_by', String, nullable=True),
+    # The (test_case_id, fixture_id) primary key covers lookups; this serves ordered listings
+    Index('ix_test_case_fixtures_test_case_id_order', 'test_case_id', 'order')
 )
 
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from .base import BaseModel
@@ -51,4 +51,9 @@ class FixtureVersion(BaseModel):
     
     # Relationships
     fixture = relationship("Fixture", back_populates="versions")
-    step_versions = relationship("StepVersion", back_populates="fixture_version", cascade="all, delete-orphan") 
\ No newline at end of file
+    step_versions = relationship("StepVersion", back_populates="fixture_version", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Serves the latest-version lookup per fixture
+        Index('ix_fixture_versions_fixture_id_created_at', 'fixture_id', 'created_at'),
+    ) 
\ No newline at end of file
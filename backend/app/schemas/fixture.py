@@ -48,4 +48,30 @@ class Fixture(FixtureBase):
     def convert_id_to_str(cls, v):
         return str(v) if isinstance(v, UUID) else v
 
-    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class FixtureSummary(BaseModel):
+    """Fixture list item; leaves out the playwright_script body"""
+    id: Union[str, UUID]
+    project_id: Union[str, UUID]
+    name: str
+    type: Optional[str] = "extend"
+    status: Optional[str] = "draft"
+    environment: Optional[str] = "all"
+    version: Optional[str] = None
+    filename: Optional[str] = None
+    export_name: Optional[str] = None
+    fixture_file_path: Optional[str] = None
+    created_by: Optional[str] = None
+    updated_by: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    author_name: Optional[str] = None
+
+    @field_validator('id', 'project_id')
+    @classmethod
+    def convert_uuid_to_str(cls, v):
+        return str(v) if isinstance(v, UUID) else v
+
+    model_config = ConfigDict(from_attributes=True)
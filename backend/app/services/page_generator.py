@@ -1,11 +1,16 @@
 import os
 import re
+import logging
+import threading
+from itertools import groupby
 from typing import List, Dict, Any
 from sqlalchemy.orm import Session
 from ..models.page import Page as PageModel
 from ..models.page_element import PageLocator as PageLocatorModel
 from ..models.project import Project as ProjectModel
 
+logger = logging.getLogger(__name__)
+
 
 class PageGenerator:
     def __init__(self, project_path: str):
@@ -17,26 +22,32 @@ class PageGenerator:
         """Generate page object file for a project"""
         try:
             # Get project
-            project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-            if not project:
+            if not db.query(db.query(ProjectModel.id).filter(ProjectModel.id == project_id).exists()).scalar():
                 return False
                 
-            # Get all pages with their locators
-            pages = db.query(PageModel).filter(PageModel.project_id == project_id).all()
+            # Get all pages with their locators: one query, only the columns the file needs
+            rows = (
+                db.query(PageModel.id, PageModel.name, PageLocatorModel.locator_key, PageLocatorModel.locator_value)
+                .outerjoin(PageLocatorModel, PageLocatorModel.page_id == PageModel.id)
+                .filter(PageModel.project_id == project_id)
+                .order_by(PageModel.created_at, PageModel.id, PageLocatorModel.created_at)
+                .all()
+            )
             
-            if not pages:
+            if not rows:
                 return False
                 
             # Prepare flat content lines
             locator_lines: List[str] = []
-            for page in pages:
-                page_name_camel = self._to_camel_case(page.name)
-                # Get locators for this page
-                locators = db.query(PageLocatorModel).filter(PageLocatorModel.page_id == page.id).all()
-                if not locators:
+            for _, page_rows in groupby(rows, key=lambda row: row.id):
+                page_rows = [row for row in page_rows if row.locator_key is not None]
+                # Pages without locators contribute nothing
+                if not page_rows:
                     continue
-                locator_lines.append(f"  // {page.name} Page")
-                for loc in locators:
+                page_name = page_rows[0].name
+                page_name_camel = self._to_camel_case(page_name)
+                locator_lines.append(f"  // {page_name} Page")
+                for loc in page_rows:
                     key_camel = self._to_camel_case(loc.locator_key)
                     value = loc.locator_value
                     locator_lines.append(f"  readonly {page_name_camel}_{key_camel} = '{value}';")
@@ -59,8 +70,8 @@ class PageGenerator:
                 
             return True
             
-        except Exception as e:
-            print(f"Error generating page object: {e}")
+        except Exception:
+            logger.exception("Error generating page object")
             return False
     
     def _to_camel_case(self, text: str) -> str:
@@ -86,3 +97,40 @@ def generate_page_object_for_project(db: Session, project_id: str, project_path:
     """Helper function to generate page object for a project"""
     generator = PageGenerator(project_path)
     return generator.generate_page_object(db, project_id)
+
+
+# Quiet period before a scheduled regeneration runs; edits inside it coalesce into one write
+REGENERATION_DEBOUNCE_SECONDS = 0.5
+
+_pending_regenerations: Dict[str, threading.Timer] = {}
+_pending_lock = threading.Lock()
+
+
+def _run_scheduled_generation(project_id: str, project_path: str) -> None:
+    with _pending_lock:
+        # A newer schedule may have replaced this timer; only clear our own entry
+        if _pending_regenerations.get(project_id) is threading.current_thread():
+            del _pending_regenerations[project_id]
+    
+    # Runs after the request finished, so it needs its own session
+    from ..database import get_session_local
+    db = get_session_local()()
+    try:
+        generate_page_object_for_project(db, project_id, project_path)
+    except Exception:
+        logger.exception("Failed to generate page object")
+    finally:
+        db.close()
+
+
+def schedule_page_object_generation(project_id: str, project_path: str, delay: float = REGENERATION_DEBOUNCE_SECONDS) -> None:
+    """Regenerate a project's page object after a short debounce, restarting it on every new edit"""
+    project_id = str(project_id)
+    timer = threading.Timer(delay, _run_scheduled_generation, args=(project_id, project_path))
+    timer.daemon = True
+    with _pending_lock:
+        previous = _pending_regenerations.get(project_id)
+        if previous is not None:
+            previous.cancel()
+        _pending_regenerations[project_id] = timer
+        timer.start()
@@ -21,6 +21,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Per-step comment block and fallback body, bound once instead of formatted via f-strings per step
+_STEP_HEADER_FMT = "// Step %s: %s\n// Data: %s\n// Expected: %s\n".__mod__
+_STEP_TODO_FMT = "// TODO: Implement step %s\n".__mod__
+
 
 class PlaywrightFixtureGenerator:
     """Generator class for creating Playwright fixture files from templates."""
@@ -152,30 +156,26 @@ class PlaywrightFixtureGenerator:
         # Handle {{#if steps}} blocks
         steps = context.get('steps', [])
         if steps:
-            # Handle {{#each steps}} loop first
-            steps_content = ""
+            # Handle {{#each steps}} loop first; collect parts and join once
+            parts = []
+            append = parts.append
+            last = len(steps) - 1
             for i, step in enumerate(steps):
-                step_content = f"// Step {step.get('order', i+1)}: {step.get('action', 'Unknown')}\n"
-                
-                # Add Data line
-                data = step.get('data', '')
-                step_content += f"// Data: {data}\n"
-                
-                # Add Expected line
-                expected = step.get('expected', '')
-                step_content += f"// Expected: {expected}\n"
+                order = step.get('order', i+1)
+                append(_STEP_HEADER_FMT((order, step.get('action', 'Unknown'), step.get('data', ''), step.get('expected', ''))))
                 
                 # Add playwright script
-                if step.get('playwright_script'):
-                    step_content += f"{step['playwright_script']}\n"
+                script = step.get('playwright_script')
+                if script:
+                    append(script)
+                    append("\n")
                 else:
-                    step_content += f"// TODO: Implement step {step.get('order', i+1)}\n"
+                    append(_STEP_TODO_FMT(order))
                 
                 # Add spacing between steps (except last one)
-                if i < len(steps) - 1:
-                    step_content += "\n"
-                
-                steps_content += step_content
+                if i < last:
+                    append("\n")
+            steps_content = "".join(parts)
             
             # Replace {{#each steps}}...{{/each}} with actual steps content
             rendered = re.sub(
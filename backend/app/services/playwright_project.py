@@ -348,8 +348,8 @@ class PlaywrightProjectManager:
             from ..models.project_setting import ProjectSetting
             
             # Get project settings from database
-            settings = db_session.query(ProjectSetting).filter(ProjectSetting.project_id == project_id).all()
-            settings_dict = {setting.key: setting.value for setting in settings}
+            rows = db_session.query(ProjectSetting.key, ProjectSetting.value).filter(ProjectSetting.project_id == project_id).all()
+            settings_dict = {key: value for key, value in rows}
             
             # Read the template file
             template_path = Path(__file__).parent.parent.parent / "template" / "playwright.config.ts.template"
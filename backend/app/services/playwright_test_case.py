@@ -570,6 +570,9 @@ class PlaywrightTestCaseGenerator:
                         # Rename old file to new name
                         logger.info(f"Renaming old file: {old_file_path} -> {target_file_path}")
                         old_file_path.rename(target_file_path)
+                        # Refresh the renamed file so disk matches the generated content
+                        with open(target_file_path, 'w', encoding='utf-8') as f:
+                            f.write(test_result['content'])
                         logger.info(f"Successfully renamed file")
                     elif old_file_path.exists() and old_file_path == target_file_path:
                         # Same path, just overwrite content
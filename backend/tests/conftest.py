@@ -1,10 +1,14 @@
 import pytest
 import pytest_asyncio
 import asyncio
+from contextlib import contextmanager
 from typing import AsyncGenerator
 from httpx import AsyncClient, ASGITransport
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy.pool import StaticPool
 from fastapi import FastAPI
 
@@ -25,6 +29,46 @@ def dict_to_object(data):
                 setattr(self, key, value)
     return DataObject(data)
 
+@contextmanager
+def count_queries():
+    """Collect every SQL statement executed on any engine inside the block"""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", _record)
+
+@pytest.fixture
+def query_counter():
+    """Context manager that records the SQL statements a block executes"""
+    return count_queries
+
+@contextmanager
+def raise_on_lazy_load(*models):
+    """Make any lazy relationship load on the given models raise inside the block"""
+    def _add_raiseload(orm_execute_state):
+        if not orm_execute_state.is_select or orm_execute_state.is_relationship_load:
+            return
+        statement = orm_execute_state.statement
+        if any(desc["type"] in models for desc in statement.column_descriptions):
+            orm_execute_state.statement = statement.options(raiseload("*"))
+
+    event.listen(Session, "do_orm_execute", _add_raiseload)
+    try:
+        yield
+    finally:
+        event.remove(Session, "do_orm_execute", _add_raiseload)
+
+@pytest.fixture
+def lazy_load_guard():
+    """Context manager that turns lazy loads of the given models into errors"""
+    return raise_on_lazy_load
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
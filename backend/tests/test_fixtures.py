@@ -180,4 +180,60 @@ class TestFixtures:
         
         data = response.json()
         assert data["name"] == fixture_data["name"]
-        assert data["type"] == fixture_data["type"] 
\ No newline at end of file
+        assert data["type"] == fixture_data["type"]
+    
+    async def test_get_fixtures_by_project_includes_author_name(self, async_client, auth_headers, test_project, test_user_data):
+        """Test that listed fixtures carry their author's username"""
+        fixture_data = {
+            "name": "Authored Fixture",
+            "project_id": str(test_project.id),
+            "type": "extend"
+        }
+        
+        response = await async_client.post("/api/v1/fixtures/", json=fixture_data, headers=auth_headers)
+        assert response.status_code == status.HTTP_201_CREATED
+        fixture_id = response.json()["id"]
+        
+        response = await async_client.get(f"/api/v1/fixtures/?project_id={test_project.id}", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        
+        created = next(f for f in response.json() if f["id"] == fixture_id)
+        assert created["author_name"] == test_user_data["username"]
+    
+    async def test_get_fixtures_omits_playwright_script(self, async_client, auth_headers, test_fixture):
+        """Test that the list view leaves out the script body"""
+        response = await async_client.get("/api/v1/fixtures/", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        
+        data = response.json()
+        assert len(data) >= 1
+        for fixture in data:
+            assert "playwright_script" not in fixture
+            assert fixture["status"] is not None
+    
+    async def test_get_fixture_versions_not_found(self, async_client, auth_headers):
+        """Test listing versions of a non-existent fixture"""
+        response = await async_client.get("/api/v1/fixtures/00000000-0000-0000-0000-000000000000/versions", headers=auth_headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+    
+    async def test_get_fixtures_by_project_query_count_is_flat(self, async_client, auth_headers, test_project, query_counter):
+        """Test that listing fixtures does not issue a query per fixture"""
+        url = f"/api/v1/fixtures/?project_id={test_project.id}"
+        
+        async def create_fixture(name):
+            fixture_data = {"name": name, "project_id": str(test_project.id), "type": "extend"}
+            response = await async_client.post("/api/v1/fixtures/", json=fixture_data, headers=auth_headers)
+            assert response.status_code == status.HTTP_201_CREATED
+        
+        await create_fixture("Counted Fixture 1")
+        with query_counter() as statements:
+            response = await async_client.get(url, headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        single = len(statements)
+        
+        await create_fixture("Counted Fixture 2")
+        await create_fixture("Counted Fixture 3")
+        with query_counter() as statements:
+            response = await async_client.get(url, headers=auth_headers)
+        assert len(response.json()) == 3
+        assert len(statements) == single
@@ -0,0 +1,112 @@
+import pytest
+from fastapi import status
+
+from app.models.page import Page as PageModel
+from app.models.page_element import PageLocator as PageLocatorModel
+
+# Statement caps per request; each includes the auth lookup of the current user
+CREATE_PAGE_MAX_QUERIES = 5
+UPDATE_PAGE_MAX_QUERIES = 6
+CREATE_LOCATOR_MAX_QUERIES = 7
+UPDATE_LOCATOR_MAX_QUERIES = 7
+LIST_LOCATORS_MAX_QUERIES = 5
+
+
+@pytest.fixture(autouse=True)
+def no_page_object_generation(monkeypatch):
+    """Keep the debounced page object writer from running queries inside counted blocks"""
+    monkeypatch.setattr("app.crud.page.schedule_page_object_generation", lambda *args, **kwargs: None)
+
+
+@pytest.mark.asyncio
+class TestPages:
+    """Test page and page locator endpoints"""
+    
+    async def create_page(self, async_client, auth_headers, project, name="Login Page"):
+        response = await async_client.post(
+            "/api/v1/pages/", json={"name": name, "project_id": str(project.id)}, headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        return response.json()
+    
+    async def create_locator(self, async_client, auth_headers, page_id, key):
+        response = await async_client.post(
+            f"/api/v1/pages/{page_id}/locators",
+            json={"page_id": page_id, "locator_key": key, "locator_value": f"#{key}"},
+            headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        return response.json()
+    
+    async def test_create_page(self, async_client, auth_headers, test_project, query_counter, lazy_load_guard):
+        """Test creating a page within the statement cap"""
+        with lazy_load_guard(PageModel, PageLocatorModel), query_counter() as statements:
+            data = await self.create_page(async_client, auth_headers, test_project)
+        
+        assert data["name"] == "Login Page"
+        assert data["project_id"] == str(test_project.id)
+        assert len(statements) <= CREATE_PAGE_MAX_QUERIES
+    
+    async def test_update_page(self, async_client, auth_headers, test_project, query_counter, lazy_load_guard):
+        """Test renaming a page without lazy loads"""
+        page = await self.create_page(async_client, auth_headers, test_project)
+        
+        with lazy_load_guard(PageModel, PageLocatorModel), query_counter() as statements:
+            response = await async_client.put(
+                f"/api/v1/pages/{page['id']}", json={"name": "Sign In Page"}, headers=auth_headers
+            )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["name"] == "Sign In Page"
+        assert len(statements) <= UPDATE_PAGE_MAX_QUERIES
+    
+    async def test_create_and_update_locator(self, async_client, auth_headers, test_project, query_counter, lazy_load_guard):
+        """Test locator writes without lazy loads"""
+        page = await self.create_page(async_client, auth_headers, test_project)
+        
+        with lazy_load_guard(PageModel, PageLocatorModel), query_counter() as statements:
+            locator = await self.create_locator(async_client, auth_headers, page["id"], "username")
+        assert locator["page_id"] == page["id"]
+        assert len(statements) <= CREATE_LOCATOR_MAX_QUERIES
+        
+        with lazy_load_guard(PageModel, PageLocatorModel), query_counter() as statements:
+            response = await async_client.put(
+                f"/api/v1/pages/{page['id']}/locators/{locator['id']}",
+                json={"locator_value": "[name=username]"},
+                headers=auth_headers
+            )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["locator_value"] == "[name=username]"
+        assert len(statements) <= UPDATE_LOCATOR_MAX_QUERIES
+    
+    async def test_list_locators_query_count_is_flat(self, async_client, auth_headers, test_project, query_counter, lazy_load_guard):
+        """Test that listing locators does not issue a query per locator"""
+        page = await self.create_page(async_client, auth_headers, test_project)
+        url = f"/api/v1/pages/{page['id']}/locators"
+        
+        await self.create_locator(async_client, auth_headers, page["id"], "username")
+        with lazy_load_guard(PageModel, PageLocatorModel), query_counter() as statements:
+            response = await async_client.get(url, headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        single = len(statements)
+        
+        await self.create_locator(async_client, auth_headers, page["id"], "password")
+        await self.create_locator(async_client, auth_headers, page["id"], "submit")
+        with lazy_load_guard(PageModel, PageLocatorModel), query_counter() as statements:
+            response = await async_client.get(url, headers=auth_headers)
+        assert len(response.json()) == 3
+        assert len(statements) == single
+        assert len(statements) <= LIST_LOCATORS_MAX_QUERIES
+    
+    async def test_delete_page_locator(self, async_client, auth_headers, test_project):
+        """Test deleting a locator"""
+        page = await self.create_page(async_client, auth_headers, test_project)
+        locator = await self.create_locator(async_client, auth_headers, page["id"], "username")
+        
+        response = await async_client.delete(
+            f"/api/v1/pages/{page['id']}/locators/{locator['id']}", headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        
+        response = await async_client.get(f"/api/v1/pages/{page['id']}/locators", headers=auth_headers)
+        assert response.json() == []
@@ -143,4 +143,15 @@ class TestProjects:
         
         data = response.json()
         assert isinstance(data, list)
-        assert len(data) <= 5  # Should respect limit 
\ No newline at end of file
+        assert len(data) <= 5  # Should respect limit
+    
+    async def test_upsert_project_setting_updates_existing(self, async_client, auth_headers, test_project):
+        """Test that putting an existing setting updates it in place"""
+        url = f"/api/v1/projects/{test_project.id}/settings/RETRIES"
+        first = await async_client.put(url, params={"value": "2"}, headers=auth_headers)
+        assert first.status_code == status.HTTP_200_OK
+        
+        second = await async_client.put(url, params={"value": "3"}, headers=auth_headers)
+        assert second.status_code == status.HTTP_200_OK
+        assert second.json()["id"] == first.json()["id"]
+        assert second.json()["value"] == "3"
@@ -1,4 +1,5 @@
 import pytest
+import uuid
 from httpx import AsyncClient, ASGITransport
 from fastapi import status
 from tests.conftest import get_test_app
@@ -209,4 +210,67 @@ class TestTestCases:
         assert isinstance(data, list)
         # Check that all returned test cases have pending status
         for test_case in data:
-            assert test_case["status"] == "pending" 
\ No newline at end of file
+            assert test_case["status"] == "pending" 
+    async def create_fixtures(self, async_client, auth_headers, project, count):
+        """Create fixtures in the project and return their ids"""
+        fixture_ids = []
+        for index in range(count):
+            fixture_data = {"name": f"Bulk Fixture {index}", "type": "inline", "project_id": str(project.id)}
+            response = await async_client.post("/api/v1/fixtures/", json=fixture_data, headers=auth_headers)
+            assert response.status_code == status.HTTP_201_CREATED
+            fixture_ids.append(response.json()["id"])
+        return fixture_ids
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_fixtures_appends_in_order(self, async_client, auth_headers, test_project, test_test_case):
+        """Test bulk-linked fixtures follow the order sent, after the current highest order"""
+        linked, first, second = await self.create_fixtures(async_client, auth_headers, test_project, 3)
+        response = await async_client.post(
+            f"/api/v1/test-cases/{test_test_case.id}/fixtures", json={"fixture_id": linked}, headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        
+        response = await async_client.post(
+            f"/api/v1/test-cases/{test_test_case.id}/fixtures/bulk",
+            json=[{"fixture_id": second}, {"fixture_id": first}],
+            headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [(row["fixture_id"], row["order"]) for row in response.json()] == [(second, 2), (first, 3)]
+        
+        response = await async_client.get(f"/api/v1/test-cases/{test_test_case.id}/fixtures", headers=auth_headers)
+        assert [row["fixture_id"] for row in response.json()] == [linked, second, first]
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_fixtures_skips_linked_and_duplicates(self, async_client, auth_headers, test_project, test_test_case):
+        """Test already-linked and repeated fixture ids are skipped"""
+        linked, new = await self.create_fixtures(async_client, auth_headers, test_project, 2)
+        await async_client.post(
+            f"/api/v1/test-cases/{test_test_case.id}/fixtures", json={"fixture_id": linked}, headers=auth_headers
+        )
+        
+        response = await async_client.post(
+            f"/api/v1/test-cases/{test_test_case.id}/fixtures/bulk",
+            json=[{"fixture_id": linked}, {"fixture_id": new}, {"fixture_id": new}],
+            headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [(row["fixture_id"], row["order"]) for row in response.json()] == [(new, 2)]
+        
+        response = await async_client.get(f"/api/v1/test-cases/{test_test_case.id}/fixtures", headers=auth_headers)
+        assert [(row["fixture_id"], row["order"]) for row in response.json()] == [(linked, 1), (new, 2)]
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_fixtures_unknown_fixture(self, async_client, auth_headers, test_project, test_test_case):
+        """Test an unknown fixture id rejects the whole batch"""
+        [known] = await self.create_fixtures(async_client, auth_headers, test_project, 1)
+        
+        response = await async_client.post(
+            f"/api/v1/test-cases/{test_test_case.id}/fixtures/bulk",
+            json=[{"fixture_id": known}, {"fixture_id": str(uuid.uuid4())}],
+            headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        
+        response = await async_client.get(f"/api/v1/test-cases/{test_test_case.id}/fixtures", headers=auth_headers)
+        assert response.json() == []
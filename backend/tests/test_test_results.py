@@ -1,6 +1,29 @@
 import pytest
 from fastapi import status
 import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.database import get_session_local
+from app.crud import test_result as crud_result
+from app.schemas.test_result import TestResultHistoryCreate, TestCaseExecutionCreate
+
+
+def create_result_with_executions(project_id, test_case_id, start_times):
+    """Insert a test result and one execution per start time, in the given order"""
+    db = get_session_local()()
+    try:
+        [result_id] = crud_result.bulk_create_test_results(db, [
+            TestResultHistoryCreate(project_id=project_id, name="Streamed Run", success=True, status="passed")
+        ])
+        crud_result.bulk_create_test_case_executions(db, [
+            TestCaseExecutionCreate(
+                test_result_id=result_id, test_case_id=test_case_id, status="passed", start_time=start_time
+            )
+            for start_time in start_times
+        ])
+        return result_id
+    finally:
+        db.close()
 
 @pytest.mark.asyncio
 class TestTestResults:
@@ -66,4 +89,30 @@ class TestTestResults:
         assert "total_runs" in data
         assert "successful_runs" in data
         assert "failed_runs" in data
-        assert "recent_results" in data 
\ No newline at end of file
+        assert "recent_results" in data
+
+    async def test_get_result_executions_empty(self, async_client, test_project, test_test_case):
+        """Test streaming executions of a result that has none"""
+        result_id = create_result_with_executions(test_project.id, test_test_case.id, [])
+        response = await async_client.get(f"/api/v1/test-results/{result_id}/executions")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+    async def test_get_result_executions_ordered_by_start_time(self, async_client, test_project, test_test_case):
+        """Test streaming several executions as valid JSON ordered by start_time"""
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        start_times = [base + timedelta(minutes=offset) for offset in (2, 0, 3, 1)]
+        result_id = create_result_with_executions(test_project.id, test_test_case.id, start_times)
+        
+        response = await async_client.get(f"/api/v1/test-results/{result_id}/executions")
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data) == len(start_times)
+        assert all(execution["test_result_id"] == str(result_id) for execution in data)
+        streamed_times = [datetime.fromisoformat(execution["start_time"]) for execution in data]
+        assert streamed_times == sorted(start_times)
+
+    async def test_get_result_executions_not_found(self, async_client):
+        """Test streaming executions of a non-existent test result"""
+        response = await async_client.get(f"/api/v1/test-results/{uuid.uuid4()}/executions")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
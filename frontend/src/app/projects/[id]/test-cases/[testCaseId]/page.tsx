@@ -81,11 +81,11 @@ interface TestCaseFixture {
   playwright_script: string
 }
 
+// Item of GET /fixtures/ (a summary row; the script is only returned by GET /fixtures/{id})
 interface AvailableFixture {
   id: string
   name: string
   type: string
-  playwright_script: string
   created_at: string
 }
 